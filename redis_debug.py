@@ -4,11 +4,12 @@
 Redis配置问题诊断脚本
 """
 
-import sys
-import traceback
 
 def debug_redis_config():
     """诊断Redis配置问题"""
+    import sys
+    import traceback
+    
     print("🔍 诊断Redis配置问题...")
     
     try:
@@ -5,16 +5,28 @@
 """
 
 import asyncio
+import glob
 import logging
 import json
-import schedule
+import re
 import threading
 import time
-from typing import Dict, Any, List, Optional, Callable
+from collections import deque
+from types import MappingProxyType
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Callable, Coroutine, Tuple
 from datetime import datetime, timedelta
 import sys
 import os
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
 # 添加项目根目录到Python路径
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -23,12 +35,102 @@ from scripts.mvp_validation_runner import MVPValidationRunner
 
 logger = logging.getLogger(__name__)
 
+# 判定为严重问题的关键字（不区分大小写）
+_CRITICAL_ISSUE_RE = re.compile(r'critical|failed|error', re.IGNORECASE)
+
+# 告警阈值规则：(指标路径, 阈值配置键, 指标换算系数, 阈值换算系数, 写入列表, 提示模板)
+_ALERT_THRESHOLD_RULES = (
+    (('response_time', 'avg'), 'response_time_ms', 1, 0.001, 'warnings', "响应时间过高: {:.2f}s"),
+    (('cpu_usage',), 'cpu_usage_percent', 1, 1, 'warnings', "CPU使用率过高: {:.1f}%"),
+    (('memory_usage',), 'memory_usage_percent', 1, 1, 'warnings', "内存使用率过高: {:.1f}%"),
+    (('disk_usage',), 'disk_usage_percent', 1, 1, 'issues', "磁盘使用率过高: {:.1f}%"),
+    (('error_rate',), 'error_rate_percent', 100, 1, 'issues', "错误率过高: {:.1f}%"),
+)
+
+
+# 调度配置默认值（只读，各实例按需合并复制）
+_NOTIFICATION_DEFAULTS = MappingProxyType({
+    'email_enabled': False,
+    'webhook_enabled': False,
+    'log_enabled': True
+})
+
+_ALERT_THRESHOLD_DEFAULTS = MappingProxyType({
+    'response_time_ms': 2000,
+    'cpu_usage_percent': 80,
+    'memory_usage_percent': 85,
+    'disk_usage_percent': 90,
+    'error_rate_percent': 5
+})
+
+_SCHEDULER_DEFAULTS = MappingProxyType({
+    'quick_check_interval': 5,      # 快速检查间隔（分钟）
+    'detailed_check_interval': 30,  # 详细检查间隔（分钟）
+    'full_validation_interval': 360, # 完整验证间隔（分钟，6小时）
+    'enable_quick_checks': True,
+    'enable_detailed_checks': True,
+    'enable_full_validation': True,
+    'alert_on_failures': True,
+    'save_results': True,
+    'results_directory': 'health_check_results',
+    'max_history_days': 30,
+    'max_concurrent_checks': 3,     # 组件检查的最大并发数
+    'notification_config': _NOTIFICATION_DEFAULTS,
+    'alert_thresholds': _ALERT_THRESHOLD_DEFAULTS
+})
+
+
+def _merge_scheduler_config(overrides: Dict[str, Any]) -> Dict[str, Any]:
+    """合并调度配置：用户配置覆盖默认值，嵌套配置按键合并，返回可修改的新字典"""
+    merged = {**_SCHEDULER_DEFAULTS, **overrides}
+    for key in ('notification_config', 'alert_thresholds'):
+        merged[key] = {**_SCHEDULER_DEFAULTS[key], **(overrides.get(key) or {})}
+    return merged
+
+
+def _deep_get(data: Dict[str, Any], path: Tuple[str, ...], default: Any = 0) -> Any:
+    """按路径读取嵌套字典中的值，缺失时返回默认值"""
+    for key in path:
+        if not isinstance(data, dict):
+            return default
+        data = data.get(key)
+        if data is None:
+            return default
+    return data
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """序列化为缩进 2 空格的 UTF-8 JSON（优先使用 orjson）"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _json_dumps_line(obj: Any) -> bytes:
+    """序列化为单行 UTF-8 JSON（JSON Lines 记录，含换行符）"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+def _json_loads(data: bytes) -> Any:
+    """解析 JSON（优先使用 orjson）"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class HealthCheckResult:
     """健康检查结果"""
     
+    __slots__ = ('timestamp', 'timestamp_iso', 'timestamp_tag', 'overall_status', 'component_statuses',
+                 'performance_metrics', 'issues', 'warnings', 'recommendations', 'trend_analysis')
+    
     def __init__(self):
         self.timestamp = datetime.now()
+        # 时间戳的 ISO 格式和文件名格式只格式化一次
+        self.timestamp_iso = self.timestamp.isoformat()
+        self.timestamp_tag = self.timestamp.strftime("%Y%m%d_%H%M%S")
         self.overall_status = "unknown"
         self.component_statuses = {}
         self.performance_metrics = {}
@@ -40,7 +142,7 @@ class HealthCheckResult:
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典格式"""
         return {
-            'timestamp': self.timestamp.isoformat(),
+            'timestamp': self.timestamp_iso,
             'overall_status': self.overall_status,
             'component_statuses': self.component_statuses,
             'performance_metrics': self.performance_metrics,
@@ -54,38 +156,20 @@ class HealthCheckResult:
 class HealthCheckScheduler:
     """健康检查调度器"""
     
+    # 历史索引文件（JSON Lines，每行一条检查结果，按日期分文件），启动时读取索引，只补读未被索引的旧结果文件
+    HISTORY_INDEX_PREFIX = 'history_index_'
+    HISTORY_INDEX_SUFFIX = '.jsonl'
+    # 趋势分析使用的最近检查次数，及对应的指标名（趋势分析结果的键前缀）
+    TREND_WINDOW = 3
+    TREND_METRICS = ('cpu', 'memory', 'response_time')
+    # 过期结果文件的清理间隔（秒），文件按天过期，无需每次检查后都扫描目录
+    FILE_CLEANUP_INTERVAL = 3600
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         
-        # 调度配置
-        self.scheduler_config = {
-            'quick_check_interval': 5,      # 快速检查间隔（分钟）
-            'detailed_check_interval': 30,  # 详细检查间隔（分钟）
-            'full_validation_interval': 360, # 完整验证间隔（分钟，6小时）
-            'enable_quick_checks': True,
-            'enable_detailed_checks': True,
-            'enable_full_validation': True,
-            'alert_on_failures': True,
-            'save_results': True,
-            'results_directory': 'health_check_results',
-            'max_history_days': 30,
-            'notification_config': {
-                'email_enabled': False,
-                'webhook_enabled': False,
-                'log_enabled': True
-            },
-            'alert_thresholds': {
-                'response_time_ms': 2000,
-                'cpu_usage_percent': 80,
-                'memory_usage_percent': 85,
-                'disk_usage_percent': 90,
-                'error_rate_percent': 5
-            }
-        }
-        
-        # 更新配置
-        if 'health_check_scheduler' in config:
-            self.scheduler_config.update(config['health_check_scheduler'])
+        # 调度配置（默认值与用户配置合并，嵌套配置按键合并）
+        self.scheduler_config = _merge_scheduler_config(config.get('health_check_scheduler', {}))
         
         # 初始化组件
         self.system_checker = SystemChecker(config)
@@ -94,8 +178,20 @@ class HealthCheckScheduler:
         
         # 调度器状态
         self.is_running = False
-        self.scheduler_thread = None
-        self.results_history = []
+        # 常驻事件循环（独立线程），各次检查复用，定时任务也在其中按间隔休眠唤醒
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._periodic_tasks: List[asyncio.Task] = []
+        # 结果落盘、告警发送的 I/O 线程池（按需创建），检查流程不等待文件写入
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        # 历史结果按条数封顶（按每5分钟一次检查估算），超出时自动淘汰最早的记录
+        max_history = self.scheduler_config['max_history_days'] * 24 * 60 // 5
+        self.results_history: deque = deque(maxlen=max_history)
+        self._last_file_cleanup: Optional[float] = None
+        # 趋势指标环形缓冲：每行一个指标（TREND_METRICS 顺序），每列一次检查
+        self._metric_buffer = np.zeros((len(self.TREND_METRICS), self.TREND_WINDOW), dtype=np.float64)
+        self._metric_index = 0    # 下一次写入的列
+        self._metric_filled = 0   # 已写入的检查次数（不超过 TREND_WINDOW）
         self.last_full_validation = None
         
         # 确保结果目录存在
@@ -112,29 +208,22 @@ class HealthCheckScheduler:
         
         logger.info("启动健康检查调度器")
         
-        # 清除之前的调度
-        schedule.clear()
-        
-        # 配置调度任务
-        if self.scheduler_config['enable_quick_checks']:
-            interval = self.scheduler_config['quick_check_interval']
-            schedule.every(interval).minutes.do(self._run_quick_check_sync)
-            logger.info(f"快速检查已配置，间隔: {interval} 分钟")
-        
-        if self.scheduler_config['enable_detailed_checks']:
-            interval = self.scheduler_config['detailed_check_interval']
-            schedule.every(interval).minutes.do(self._run_detailed_check_sync)
-            logger.info(f"详细检查已配置，间隔: {interval} 分钟")
-        
-        if self.scheduler_config['enable_full_validation']:
-            interval = self.scheduler_config['full_validation_interval']
-            schedule.every(interval).minutes.do(self._run_full_validation_sync)
-            logger.info(f"完整验证已配置，间隔: {interval} 分钟")
-        
-        # 启动调度器线程
+        self._start_loop()
         self.is_running = True
-        self.scheduler_thread = threading.Thread(target=self._run_scheduler, daemon=True)
-        self.scheduler_thread.start()
+        
+        # 配置定时任务
+        jobs = [
+            ('enable_quick_checks', 'quick_check_interval', self.run_quick_check, 'quick', '快速检查'),
+            ('enable_detailed_checks', 'detailed_check_interval', self.run_detailed_check, 'detailed', '详细检查'),
+            ('enable_full_validation', 'full_validation_interval', self.run_full_validation, 'full', '完整验证'),
+        ]
+        for enable_key, interval_key, check_func, check_type, label in jobs:
+            if self.scheduler_config[enable_key]:
+                interval = self.scheduler_config[interval_key]
+                self._periodic_tasks.append(self._run_coroutine(
+                    self._create_periodic_task(interval * 60, check_func, check_type, label)
+                ))
+                logger.info("%s已配置，间隔: %s 分钟", label, interval)
         
         # 立即执行一次快速检查
         self._run_quick_check_sync()
@@ -150,64 +239,85 @@ class HealthCheckScheduler:
         logger.info("停止健康检查调度器")
         
         self.is_running = False
-        schedule.clear()
+        self._stop_loop()
         
-        if self.scheduler_thread and self.scheduler_thread.is_alive():
-            self.scheduler_thread.join(timeout=5)
+        # 等待已提交的落盘、告警任务完成
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=True)
+            self._io_pool = None
         
         logger.info("健康检查调度器已停止")
     
-    def _run_scheduler(self):
-        """运行调度器主循环"""
+    def _start_loop(self):
+        """启动常驻事件循环线程"""
+        if self._loop is not None:
+            return
+        
+        self._loop = asyncio.new_event_loop()
+        # 限制默认执行器线程数，避免按 CPU 数创建大量线程
+        self._loop.set_default_executor(ThreadPoolExecutor(max_workers=4))
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever, name='health_check_loop', daemon=True
+        )
+        self._loop_thread.start()
+    
+    def _stop_loop(self):
+        """停止并关闭常驻事件循环"""
+        if self._loop is None:
+            return
+        
+        try:
+            asyncio.run_coroutine_threadsafe(self._cancel_periodic_tasks(), self._loop).result(timeout=5)
+        except Exception as e:
+            logger.warning("取消定时任务超时或失败: %s", e)
+        
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._loop_thread and self._loop_thread.is_alive():
+            self._loop_thread.join(timeout=5)
+        if not self._loop.is_running():
+            self._loop.close()
+        self._loop = None
+        self._loop_thread = None
+    
+    def _run_coroutine(self, coro: Coroutine) -> Any:
+        """在常驻事件循环中执行协程并等待结果（供同步调用方使用）"""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+    
+    async def _create_periodic_task(self, interval_seconds: float, check_func: Callable,
+                                    check_type: str, label: str) -> asyncio.Task:
+        """在常驻事件循环中创建定时任务"""
+        return asyncio.ensure_future(self._periodic(interval_seconds, check_func, check_type, label))
+    
+    async def _periodic(self, interval_seconds: float, check_func: Callable,
+                        check_type: str, label: str):
+        """按固定间隔执行检查，间隔期间事件循环休眠直至下次到期"""
         while self.is_running:
+            await asyncio.sleep(interval_seconds)
             try:
-                schedule.run_pending()
-                time.sleep(1)
+                result = await check_func()
+                self._process_check_result(result, check_type)
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                logger.error(f"调度器执行异常: {e}")
-                time.sleep(5)
+                logger.error("%s异常: %s", label, e)
+    
+    async def _cancel_periodic_tasks(self):
+        """取消全部定时任务并等待其结束"""
+        tasks, self._periodic_tasks = self._periodic_tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
     
     def _run_quick_check_sync(self):
         """同步运行快速检查"""
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(self.run_quick_check())
-            loop.close()
+            result = self._run_coroutine(self.run_quick_check())
             
             # 处理结果
             self._process_check_result(result, "quick")
             
         except Exception as e:
-            logger.error(f"快速检查异常: {e}")
-    
-    def _run_detailed_check_sync(self):
-        """同步运行详细检查"""
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(self.run_detailed_check())
-            loop.close()
-            
-            # 处理结果
-            self._process_check_result(result, "detailed")
-            
-        except Exception as e:
-            logger.error(f"详细检查异常: {e}")
-    
-    def _run_full_validation_sync(self):
-        """同步运行完整验证"""
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(self.run_full_validation())
-            loop.close()
-            
-            # 处理结果
-            self._process_check_result(result, "full")
-            
-        except Exception as e:
-            logger.error(f"完整验证异常: {e}")
+            logger.error("快速检查异常: %s", e)
     
     async def run_quick_check(self) -> HealthCheckResult:
         """运行快速健康检查"""
@@ -223,16 +333,7 @@ class HealthCheckScheduler:
                 ('data_sources', self.system_checker.check_data_source_health)
             ]
             
-            for component, check_func in critical_checks:
-                try:
-                    status = await check_func()
-                    result.component_statuses[component] = status
-                except Exception as e:
-                    result.component_statuses[component] = {
-                        'status': 'error',
-                        'error': str(e)
-                    }
-                    result.issues.append(f"{component} 检查失败: {e}")
+            await self._run_component_checks(result, critical_checks)
             
             # 获取基本性能指标
             try:
@@ -251,10 +352,10 @@ class HealthCheckScheduler:
             # 生成建议
             result.recommendations = self._generate_quick_recommendations(result)
             
-            logger.info(f"快速健康检查完成，状态: {result.overall_status}")
+            logger.info("快速健康检查完成，状态: %s", result.overall_status)
             
         except Exception as e:
-            logger.error(f"快速健康检查失败: {e}")
+            logger.error("快速健康检查失败: %s", e)
             result.overall_status = "error"
             result.issues.append(f"检查过程异常: {str(e)}")
         
@@ -277,16 +378,7 @@ class HealthCheckScheduler:
                 ('services', self.system_checker.check_service_health)
             ]
             
-            for component, check_func in all_checks:
-                try:
-                    status = await check_func()
-                    result.component_statuses[component] = status
-                except Exception as e:
-                    result.component_statuses[component] = {
-                        'status': 'error',
-                        'error': str(e)
-                    }
-                    result.issues.append(f"{component} 检查失败: {e}")
+            await self._run_component_checks(result, all_checks)
             
             # 获取详细性能指标
             try:
@@ -324,15 +416,43 @@ class HealthCheckScheduler:
             # 生成建议
             result.recommendations = self._generate_detailed_recommendations(result)
             
-            logger.info(f"详细健康检查完成，状态: {result.overall_status}")
+            logger.info("详细健康检查完成，状态: %s", result.overall_status)
             
         except Exception as e:
-            logger.error(f"详细健康检查失败: {e}")
+            logger.error("详细健康检查失败: %s", e)
             result.overall_status = "error"
             result.issues.append(f"检查过程异常: {str(e)}")
         
         return result
     
+    async def _run_component_checks(self, result: HealthCheckResult,
+                                    checks: List[tuple]):
+        """
+        并发执行各组件检查（并发数受 max_concurrent_checks 限制）
+        
+        结果按 checks 的顺序写入 result.component_statuses
+        """
+        semaphore = asyncio.Semaphore(self.scheduler_config['max_concurrent_checks'])
+        
+        async def run_check(check_func: Callable):
+            async with semaphore:
+                return await check_func()
+        
+        statuses = await asyncio.gather(
+            *(run_check(check_func) for _, check_func in checks),
+            return_exceptions=True
+        )
+        
+        for (component, _), status in zip(checks, statuses):
+            if isinstance(status, Exception):
+                result.component_statuses[component] = {
+                    'status': 'error',
+                    'error': str(status)
+                }
+                result.issues.append(f"{component} 检查失败: {status}")
+            else:
+                result.component_statuses[component] = status
+    
     async def run_full_validation(self) -> HealthCheckResult:
         """运行完整验证"""
         logger.info("执行完整MVP验证")
@@ -360,10 +480,10 @@ class HealthCheckScheduler:
             # 记录最后一次完整验证时间
             self.last_full_validation = datetime.now()
             
-            logger.info(f"完整验证完成，状态: {result.overall_status}")
+            logger.info("完整验证完成，状态: %s", result.overall_status)
             
         except Exception as e:
-            logger.error(f"完整验证失败: {e}")
+            logger.error("完整验证失败: %s", e)
             result.overall_status = "error"
             result.issues.append(f"验证过程异常: {str(e)}")
         
@@ -395,7 +515,7 @@ class HealthCheckScheduler:
         
         # 计算问题严重程度
         for issue in result.issues:
-            if any(keyword in issue.lower() for keyword in ['critical', 'failed', 'error']):
+            if _CRITICAL_ISSUE_RE.search(issue):
                 critical_issues += 1
         
         # 检查组件状态
@@ -422,75 +542,61 @@ class HealthCheckScheduler:
         thresholds = self.scheduler_config['alert_thresholds']
         metrics = result.performance_metrics
         
-        # 检查响应时间
-        response_time = metrics.get('response_time', {}).get('avg', 0)
-        if response_time > thresholds['response_time_ms'] / 1000:
-            result.warnings.append(f"响应时间过高: {response_time:.2f}s")
-        
-        # 检查CPU使用率
-        cpu_usage = metrics.get('cpu_usage', 0)
-        if cpu_usage > thresholds['cpu_usage_percent']:
-            result.warnings.append(f"CPU使用率过高: {cpu_usage:.1f}%")
-        
-        # 检查内存使用率
-        memory_usage = metrics.get('memory_usage', 0)
-        if memory_usage > thresholds['memory_usage_percent']:
-            result.warnings.append(f"内存使用率过高: {memory_usage:.1f}%")
-        
-        # 检查磁盘使用率
-        disk_usage = metrics.get('disk_usage', 0)
-        if disk_usage > thresholds['disk_usage_percent']:
-            result.issues.append(f"磁盘使用率过高: {disk_usage:.1f}%")
-        
-        # 检查错误率
-        error_rate = metrics.get('error_rate', 0) * 100
-        if error_rate > thresholds['error_rate_percent']:
-            result.issues.append(f"错误率过高: {error_rate:.1f}%")
+        for path, key, value_scale, threshold_scale, target, template in _ALERT_THRESHOLD_RULES:
+            value = _deep_get(metrics, path) * value_scale
+            if value > thresholds[key] * threshold_scale:
+                getattr(result, target).append(template.format(value))
     
     def _generate_trend_analysis(self, result: HealthCheckResult) -> Dict[str, Any]:
-        """生成趋势分析"""
+        """生成趋势分析（基于最近 TREND_WINDOW 次检查的指标环形缓冲）"""
         trend_analysis = {}
         
         try:
-            # 获取历史数据进行趋势分析
-            if len(self.results_history) >= 3:
-                recent_results = self.results_history[-3:]
-                
-                # CPU使用率趋势
-                cpu_values = [r.get('performance_metrics', {}).get('cpu_usage', 0) 
-                             for r in recent_results]
-                if cpu_values:
-                    trend_analysis['cpu_trend'] = self._calculate_trend(cpu_values)
-                
-                # 内存使用率趋势
-                memory_values = [r.get('performance_metrics', {}).get('memory_usage', 0) 
-                               for r in recent_results]
-                if memory_values:
-                    trend_analysis['memory_trend'] = self._calculate_trend(memory_values)
-                
-                # 响应时间趋势
-                response_time_values = [
-                    r.get('performance_metrics', {}).get('response_time', {}).get('avg', 0)
-                    for r in recent_results
-                ]
-                if response_time_values:
-                    trend_analysis['response_time_trend'] = self._calculate_trend(response_time_values)
+            if self._metric_filled >= self.TREND_WINDOW:
+                # 从最早写入的列开始按时间顺序取出
+                order = (self._metric_index + np.arange(self.TREND_WINDOW)) % self.TREND_WINDOW
+                window = self._metric_buffer[:, order]
+                for name, values in zip(self.TREND_METRICS, window):
+                    trend_analysis[f'{name}_trend'] = self._calculate_trend(values)
         
         except Exception as e:
-            logger.error(f"生成趋势分析失败: {e}")
+            logger.error("生成趋势分析失败: %s", e)
         
         return trend_analysis
     
+    def _record_trend_metrics(self, result_dict: Dict[str, Any]):
+        """将一次检查的趋势指标写入环形缓冲"""
+        metrics = result_dict.get('performance_metrics') or {}
+        response_time = metrics.get('response_time') or {}
+        values = (
+            metrics.get('cpu_usage', 0),
+            metrics.get('memory_usage', 0),
+            response_time.get('avg', 0) if isinstance(response_time, dict) else 0,
+        )
+        try:
+            self._metric_buffer[:, self._metric_index] = values
+        except (TypeError, ValueError):
+            # 指标缺失或格式异常时按 0 记录，保持与历史记录一一对应
+            self._metric_buffer[:, self._metric_index] = 0.0
+        self._metric_index = (self._metric_index + 1) % self.TREND_WINDOW
+        self._metric_filled = min(self._metric_filled + 1, self.TREND_WINDOW)
+    
     def _calculate_trend(self, values: List[float]) -> Dict[str, Any]:
-        """计算趋势"""
+        """
+        计算趋势
+        
+        对序列做最小二乘线性拟合，change_rate 为每次检查的斜率相对均值的百分比
+        """
         if len(values) < 2:
             return {'direction': 'stable', 'change_rate': 0}
         
-        # 计算简单线性趋势
-        recent_avg = sum(values[-2:]) / 2
-        earlier_avg = sum(values[:-2]) / max(len(values) - 2, 1)
+        y = np.asarray(values, dtype=np.float64)
+        x = np.arange(y.size, dtype=np.float64)
+        x -= x.mean()
+        # 闭式最小二乘斜率：x 已中心化，slope = Σx·y / Σx²
+        slope = float(np.dot(x, y) / np.dot(x, x))
         
-        change_rate = ((recent_avg - earlier_avg) / max(earlier_avg, 0.01)) * 100
+        change_rate = slope / max(float(y.mean()), 0.01) * 100
         
         if change_rate > 5:
             direction = 'increasing'
@@ -502,8 +608,8 @@ class HealthCheckScheduler:
         return {
             'direction': direction,
             'change_rate': change_rate,
-            'current_value': values[-1] if values else 0,
-            'previous_value': values[-2] if len(values) > 1 else 0
+            'current_value': float(y[-1]),
+            'previous_value': float(y[-2])
         }
     
     def _generate_quick_recommendations(self, result: HealthCheckResult) -> List[str]:
@@ -556,72 +662,103 @@ class HealthCheckScheduler:
             result_dict = result.to_dict()
             result_dict['check_type'] = check_type
             self.results_history.append(result_dict)
+            self._record_trend_metrics(result_dict)
             
-            # 保存结果
+            # 保存结果（提交到 I/O 线程池）
             if self.scheduler_config['save_results']:
-                self._save_result(result, check_type)
+                self._get_io_pool().submit(self._persist_result, result, check_type, result_dict)
             
-            # 发送告警
+            # 发送告警（提交到 I/O 线程池）
             if (self.scheduler_config['alert_on_failures'] and 
                 result.overall_status in ['unhealthy', 'critical', 'error']):
-                self._send_alert(result, check_type)
+                self._get_io_pool().submit(self._send_alert, result, check_type)
             
             # 清理老旧历史
             self._cleanup_history()
             
         except Exception as e:
-            logger.error(f"处理检查结果失败: {e}")
+            logger.error("处理检查结果失败: %s", e)
+    
+    def _get_io_pool(self) -> ThreadPoolExecutor:
+        """获取 I/O 线程池（首次使用时创建）"""
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='hc_io')
+        return self._io_pool
     
-    def _save_result(self, result: HealthCheckResult, check_type: str):
+    def _persist_result(self, result: HealthCheckResult, check_type: str, result_dict: Dict[str, Any]):
+        """保存结果文件并追加历史索引（在 I/O 线程中执行）"""
+        self._save_result(result, check_type, result_dict)
+        self._append_history_index(result_dict, result.timestamp)
+    
+    def _save_result(self, result: HealthCheckResult, check_type: str,
+                     result_dict: Optional[Dict[str, Any]] = None):
         """保存检查结果"""
         try:
-            timestamp = result.timestamp.strftime("%Y%m%d_%H%M%S")
-            filename = f"health_check_{check_type}_{timestamp}.json"
+            filename = f"health_check_{check_type}_{result.timestamp_tag}.json"
             filepath = os.path.join(self.scheduler_config['results_directory'], filename)
             
-            result_dict = result.to_dict()
-            result_dict['check_type'] = check_type
+            # 调用方已转换过的字典直接复用
+            if result_dict is None:
+                result_dict = result.to_dict()
+                result_dict['check_type'] = check_type
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(result_dict, f, indent=2, ensure_ascii=False)
+            # 只序列化一次，结果文件和最新结果文件写入同一份数据
+            data = _json_dumps(result_dict)
+            with open(filepath, 'wb') as f:
+                f.write(data)
             
             # 更新最新结果文件
             latest_filepath = os.path.join(
                 self.scheduler_config['results_directory'], 
                 f"latest_{check_type}_check.json"
             )
-            with open(latest_filepath, 'w', encoding='utf-8') as f:
-                json.dump(result_dict, f, indent=2, ensure_ascii=False)
+            with open(latest_filepath, 'wb') as f:
+                f.write(data)
                 
         except Exception as e:
-            logger.error(f"保存检查结果失败: {e}")
+            logger.error("保存检查结果失败: %s", e)
+    
+    def _append_history_index(self, result_dict: Dict[str, Any], timestamp: datetime):
+        """将检查结果追加到当日的历史索引文件"""
+        try:
+            filename = f"{self.HISTORY_INDEX_PREFIX}{timestamp:%Y%m%d}{self.HISTORY_INDEX_SUFFIX}"
+            filepath = os.path.join(self.scheduler_config['results_directory'], filename)
+            with open(filepath, 'ab') as f:
+                f.write(_json_dumps_line(result_dict))
+        except Exception as e:
+            logger.error("写入历史索引失败: %s", e)
     
     def _send_alert(self, result: HealthCheckResult, check_type: str):
         """发送告警"""
         try:
-            alert_message = f"健康检查告警 - {check_type.upper()}"
-            alert_details = [
-                f"时间: {result.timestamp.strftime('%Y-%m-%d %H:%M:%S')}",
-                f"状态: {result.overall_status.upper()}",
-                f"问题数量: {len(result.issues)}"
-            ]
-            
-            if result.issues:
-                alert_details.append("关键问题:")
-                alert_details.extend([f"  • {issue}" for issue in result.issues[:3]])
-                if len(result.issues) > 3:
-                    alert_details.append(f"  ... 还有 {len(result.issues) - 3} 个问题")
-            
-            alert_text = "\n".join([alert_message] + alert_details)
-            
-            # 记录到日志
-            if self.scheduler_config['notification_config']['log_enabled']:
-                logger.warning(alert_text)
+            # 记录到日志：告警字段通过 extra 附带在日志记录的 alert 属性上，
+            # 下游处理器（JSON 日志、Webhook 等）可直接读取，无需解析文本
+            if (self.scheduler_config['notification_config']['log_enabled'] and
+                    logger.isEnabledFor(logging.WARNING)):
+                issues = result.issues
+                issue_lines = ''
+                if issues:
+                    issue_lines = "\n关键问题:\n" + "\n".join(f"  • {issue}" for issue in issues[:3])
+                    if len(issues) > 3:
+                        issue_lines += f"\n  ... 还有 {len(issues) - 3} 个问题"
+                
+                logger.warning(
+                    "健康检查告警 - %s\n时间: %s\n状态: %s\n问题数量: %d%s",
+                    check_type.upper(), result.timestamp.strftime('%Y-%m-%d %H:%M:%S'),
+                    result.overall_status.upper(), len(issues), issue_lines,
+                    extra={'alert': {
+                        'check_type': check_type,
+                        'status': result.overall_status,
+                        'timestamp': result.timestamp_iso,
+                        'issue_count': len(issues),
+                        'issues': issues[:3]
+                    }}
+                )
             
             # 其他告警方式（邮件、Webhook等）可以在这里添加
             
         except Exception as e:
-            logger.error(f"发送告警失败: {e}")
+            logger.error("发送告警失败: %s", e)
     
     def _load_history(self):
         """加载历史结果"""
@@ -630,27 +767,70 @@ class HealthCheckScheduler:
             if not os.path.exists(results_dir):
                 return
             
-            # 加载最近的结果文件
-            for filename in os.listdir(results_dir):
-                if filename.startswith('health_check_') and filename.endswith('.json'):
-                    filepath = os.path.join(results_dir, filename)
-                    try:
-                        with open(filepath, 'r', encoding='utf-8') as f:
-                            result_data = json.load(f)
-                            self.results_history.append(result_data)
-                    except Exception as e:
-                        logger.warning(f"加载历史结果文件失败 {filename}: {e}")
-            
-            # 按时间排序
-            self.results_history.sort(key=lambda x: x.get('timestamp', ''))
-            
-            # 限制历史记录数量
-            max_history = self.scheduler_config['max_history_days'] * 24 * 60 // 5  # 假设5分钟一次检查
-            if len(self.results_history) > max_history:
-                self.results_history = self.results_history[-max_history:]
+            index_files = sorted(glob.iglob(os.path.join(
+                glob.escape(results_dir), f"{self.HISTORY_INDEX_PREFIX}*{self.HISTORY_INDEX_SUFFIX}"
+            )))
+            
+            # 优先从历史索引顺序读取，并记下已索引结果对应的文件名
+            records = []
+            indexed_files = set()
+            for filepath in index_files:
+                filename = os.path.basename(filepath)
+                with open(filepath, 'rb') as f:
+                    for line_no, line in enumerate(f, 1):
+                        try:
+                            record = _json_loads(line)
+                        except ValueError as e:
+                            logger.warning("跳过损坏的历史索引记录 %s:%s: %s", filename, line_no, e)
+                            continue
+                        records.append(record)
+                        indexed_files.add(self._result_filename(record))
+            
+            # 升级前生成的结果文件没有索引记录，按文件名找出后补充读取
+            legacy_files = [
+                filepath for filepath in glob.iglob(os.path.join(glob.escape(results_dir), 'health_check_*.json'))
+                if os.path.basename(filepath) not in indexed_files
+            ]
+            records.extend(self._load_result_files(legacy_files))
+            
+            # 索引由多个 I/O 线程追加，行序不保证按时间；排序后放入有界历史，超出上限的最早记录自动丢弃
+            records.sort(key=lambda x: x.get('timestamp', ''))
+            self.results_history.extend(records)
+            
+            # 用最近几次结果初始化趋势指标缓冲
+            start = max(len(self.results_history) - self.TREND_WINDOW, 0)
+            for i in range(start, len(self.results_history)):
+                self._record_trend_metrics(self.results_history[i])
                 
         except Exception as e:
-            logger.error(f"加载历史结果失败: {e}")
+            logger.error("加载历史结果失败: %s", e)
+    
+    @staticmethod
+    def _result_filename(record: Dict[str, Any]) -> Optional[str]:
+        """索引记录对应的结果文件名（与 _save_result 的命名一致），无法推导时返回 None"""
+        try:
+            timestamp = datetime.fromisoformat(record['timestamp'])
+            return f"health_check_{record['check_type']}_{timestamp:%Y%m%d_%H%M%S}.json"
+        except (KeyError, TypeError, ValueError):
+            return None
+    
+    def _load_result_files(self, filepaths: List[str]) -> List[Dict[str, Any]]:
+        """用线程池并行读取、解析未被历史索引覆盖的结果文件"""
+        if not filepaths:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            return [data for data in executor.map(self._read_result_file, filepaths) if data is not None]
+    
+    @staticmethod
+    def _read_result_file(filepath: str) -> Optional[Dict[str, Any]]:
+        """读取并解析单个结果文件，失败时返回 None"""
+        try:
+            with open(filepath, 'rb') as f:
+                return _json_loads(f.read())
+        except Exception as e:
+            logger.warning("加载历史结果文件失败 %s: %s", os.path.basename(filepath), e)
+            return None
     
     def _cleanup_history(self):
         """清理历史记录"""
@@ -658,43 +838,53 @@ class HealthCheckScheduler:
             cutoff_date = datetime.now() - timedelta(days=self.scheduler_config['max_history_days'])
             cutoff_str = cutoff_date.isoformat()
             
-            # 清理内存中的历史记录
-            self.results_history = [
-                result for result in self.results_history
-                if result.get('timestamp', '') > cutoff_str
-            ]
+            # 清理内存中的历史记录：历史按时间顺序排列，只需从头部弹出过期记录
+            history = self.results_history
+            while history and history[0].get('timestamp', '') <= cutoff_str:
+                history.popleft()
+            
+            # 清理文件系统中的历史文件（每 FILE_CLEANUP_INTERVAL 秒最多一次）
+            now = time.monotonic()
+            if (self._last_file_cleanup is not None and
+                    now - self._last_file_cleanup < self.FILE_CLEANUP_INTERVAL):
+                return
+            self._last_file_cleanup = now
             
-            # 清理文件系统中的历史文件
             results_dir = self.scheduler_config['results_directory']
             if os.path.exists(results_dir):
-                for filename in os.listdir(results_dir):
-                    if (filename.startswith('health_check_') and 
-                        filename.endswith('.json') and 
-                        not filename.startswith('latest_')):
-                        
-                        filepath = os.path.join(results_dir, filename)
-                        file_time = datetime.fromtimestamp(os.path.getmtime(filepath))
+                cutoff_ts = cutoff_date.timestamp()
+                # scandir 的目录项缓存 stat 结果，每个文件只需一次 stat
+                with os.scandir(results_dir) as entries:
+                    for entry in entries:
+                        filename = entry.name
+                        is_result_file = filename.startswith('health_check_') and filename.endswith('.json')
+                        is_index_file = (filename.startswith(self.HISTORY_INDEX_PREFIX) and
+                                         filename.endswith(self.HISTORY_INDEX_SUFFIX))
+                        if not (is_result_file or is_index_file):
+                            continue
                         
-                        if file_time < cutoff_date:
+                        if entry.stat().st_mtime < cutoff_ts:
                             try:
-                                os.remove(filepath)
-                                logger.debug(f"已删除过期结果文件: {filename}")
+                                os.remove(entry.path)
+                                logger.debug("已删除过期结果文件: %s", filename)
                             except Exception as e:
-                                logger.warning(f"删除过期文件失败 {filename}: {e}")
+                                logger.warning("删除过期文件失败 %s: %s", filename, e)
                                 
         except Exception as e:
-            logger.error(f"清理历史记录失败: {e}")
+            logger.error("清理历史记录失败: %s", e)
     
     def get_status_summary(self) -> Dict[str, Any]:
         """获取状态摘要"""
         try:
-            latest_result = self.results_history[-1] if self.results_history else None
+            # 历史由调度线程并发追加、淘汰，先在调用线程上取快照再遍历
+            history = list(self.results_history)
+            latest_result = history[-1] if history else None
             
             summary = {
                 'scheduler_status': 'running' if self.is_running else 'stopped',
                 'last_check_time': latest_result.get('timestamp') if latest_result else None,
                 'last_check_status': latest_result.get('overall_status') if latest_result else 'unknown',
-                'total_checks': len(self.results_history),
+                'total_checks': len(history),
                 'last_full_validation': self.last_full_validation.isoformat() if self.last_full_validation else None,
                 'recent_issues': 0,
                 'recent_warnings': 0
@@ -704,15 +894,17 @@ class HealthCheckScheduler:
             recent_cutoff = datetime.now() - timedelta(hours=1)
             recent_cutoff_str = recent_cutoff.isoformat()
             
-            for result in self.results_history:
-                if result.get('timestamp', '') > recent_cutoff_str:
-                    summary['recent_issues'] += len(result.get('issues', []))
-                    summary['recent_warnings'] += len(result.get('warnings', []))
+            # 历史按时间顺序追加，从尾部倒序遍历，遇到超出时间窗口的记录即停止
+            for result in reversed(history):
+                if result.get('timestamp', '') <= recent_cutoff_str:
+                    break
+                summary['recent_issues'] += len(result.get('issues', []))
+                summary['recent_warnings'] += len(result.get('warnings', []))
             
             return summary
             
         except Exception as e:
-            logger.error(f"获取状态摘要失败: {e}")
+            logger.error("获取状态摘要失败: %s", e)
             return {'error': str(e)}
 
 
@@ -742,7 +934,7 @@ async def main():
             with open(args.config, 'r', encoding='utf-8') as f:
                 config = json.load(f)
         else:
-            logger.warning(f"配置文件 {args.config} 不存在，使用默认配置")
+            logger.warning("配置文件 %s 不存在，使用默认配置", args.config)
             config = {}
         
         # 创建调度器
@@ -776,7 +968,7 @@ async def main():
                 while True:
                     await asyncio.sleep(60)
                     summary = scheduler.get_status_summary()
-                    logger.info(f"调度器状态: {summary}")
+                    logger.info("调度器状态: %s", summary)
             except KeyboardInterrupt:
                 logger.info("收到停止信号")
             finally:
@@ -804,7 +996,7 @@ async def main():
                 print("调度器已停止")
                 
     except Exception as e:
-        logger.error(f"执行失败: {e}")
+        logger.error("执行失败: %s", e)
         print(f"错误: {e}")
         sys.exit(1)
 
@@ -5,21 +5,146 @@ MVP验证运行器
 """
 
 import asyncio
+import io
 import logging
 import json
-from typing import Dict, Any, List, Optional
+from functools import cached_property, partial
+from itertools import chain
+from typing import Dict, Any, List, Optional, Awaitable, Tuple
 from datetime import datetime, timedelta
 import sys
 import os
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
 # 添加项目根目录到Python路径
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.validation import MVPValidator, PerformanceAnalyzer, SystemChecker, BenchmarkRunner
-from src.optimization import DatabaseOptimizer, CacheManager, MemoryOptimizer, ConfigTuner
-
 logger = logging.getLogger(__name__)
 
+# 摘要报告的分隔线
+_REPORT_RULE = "=" * 60
+_SECTION_RULE = "-" * 20
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """序列化为缩进 2 空格的 UTF-8 JSON（优先使用 orjson）"""
+    if HAS_ORJSON:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _json_dumps_line(obj: Any) -> bytes:
+    """序列化为单行 UTF-8 JSON（JSON Lines 记录，含换行符）"""
+    if HAS_ORJSON:
+        return orjson.dumps(
+            obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+        )
+    return (json.dumps(obj, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+def _append_bytes(filepath: str, data: bytes):
+    """追加写入二进制文件"""
+    with open(filepath, 'ab') as f:
+        f.write(data)
+
+
+def _write_bytes(filepath: str, data: bytes):
+    """写入二进制文件（先写临时文件再原子替换，读取方不会读到写了一半的文件）"""
+    tmp_filepath = filepath + '.tmp'
+    with open(tmp_filepath, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_filepath, filepath)
+
+
+def _write_results(filepath: str, latest_filepath: str, data: bytes):
+    """
+    写入验证结果文件，并更新最新结果文件
+    
+    POSIX 系统下最新结果文件是指向结果文件的相对符号链接（原子替换，不重复写入内容），
+    不支持符号链接时写入一份副本
+    """
+    _write_bytes(filepath, data)
+    
+    if os.name == 'posix':
+        tmp_link = latest_filepath + '.tmp'
+        try:
+            if os.path.lexists(tmp_link):
+                os.remove(tmp_link)
+            os.symlink(os.path.basename(filepath), tmp_link)
+            os.replace(tmp_link, latest_filepath)
+            return
+        except OSError as e:
+            logger.debug(f"创建最新结果符号链接失败，改为写入副本: {e}")
+    
+    _write_bytes(latest_filepath, data)
+
+
+def _group_by_severity(bottlenecks: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """将性能瓶颈按严重程度（critical/warning/info）分组，未标注的归入 info"""
+    groups = {'critical': [], 'warning': [], 'info': []}
+    for bottleneck in bottlenecks:
+        groups.setdefault(bottleneck.get('severity', 'info'), []).append(bottleneck)
+    return groups
+
+
+async def _bounded(coro: Awaitable, timeout: Optional[float], label: str) -> Any:
+    """
+    限时等待协程
+    
+    超时时取消协程并返回 {'status': 'timeout', ...}，timeout 为 None 时不限时
+    """
+    try:
+        return await asyncio.wait_for(coro, timeout)
+    except asyncio.TimeoutError:
+        logger.error(f"{label} 超时（{timeout}秒）")
+        return {
+            'status': 'timeout',
+            'label': label,
+            'error': f"超时（{timeout}秒）"
+        }
+
+
+async def _gather_named(coros: Dict[str, Awaitable], label: str,
+                        timeout: Optional[float] = None) -> Dict[str, Any]:
+    """
+    并发等待一组命名的协程，按名称返回结果
+    
+    单个协程抛出异常时记录为 {'status': 'failed', 'error': ...}，超过 timeout 秒时记录为
+    {'status': 'timeout', ...}，均不影响其余协程
+    """
+    names = list(coros)
+    results = await asyncio.gather(
+        *(_bounded(coro, timeout, f"{label} {name}") for name, coro in coros.items()),
+        return_exceptions=True
+    )
+    
+    gathered = {}
+    for name, value in zip(names, results):
+        if isinstance(value, Exception):
+            logger.error(f"{label} {name} 失败: {value}")
+            value = {
+                'status': 'failed',
+                'error': str(value)
+            }
+        gathered[name] = value
+    return gathered
+
+
+def _failed_entries(results: Dict[str, Any]) -> List[str]:
+    """_gather_named 结果中失败或超时的条目名称"""
+    return [
+        name for name, value in results.items()
+        if isinstance(value, dict) and value.get('status') in ('failed', 'timeout')
+    ]
+
 
 class ValidationResult:
     """验证结果"""
@@ -35,6 +160,17 @@ class ValidationResult:
         self.warnings = []
         self.recommendations = []
         self.timestamp = datetime.now()
+        self._json = None
+    
+    def to_json(self) -> bytes:
+        """
+        转换为 UTF-8 编码的 JSON
+        
+        结果定稿（保存结果）时生成并缓存，之后保存到其他位置直接复用，不再重新序列化
+        """
+        if self._json is None:
+            self._json = _json_dumps(self.to_dict())
+        return self._json
     
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典格式"""
@@ -55,6 +191,40 @@ class ValidationResult:
 class MVPValidationRunner:
     """MVP验证运行器"""
     
+    # 基准测试套件名称 -> BenchmarkRunner 方法名
+    BENCHMARK_METHODS = {
+        'data_processing': 'run_data_processing_benchmark',
+        'trading_operations': 'run_trading_benchmark',
+        'database_operations': 'run_database_benchmark',
+        'cache_operations': 'run_cache_benchmark'
+    }
+    
+    # 基准测试结果在内存中保留的摘要字段（完整结果写入明细文件）
+    BENCHMARK_SUMMARY_FIELDS = (
+        'status', 'success_rate', 'success_count', 'error_count',
+        'throughput', 'avg_latency', 'p95_latency', 'p99_latency'
+    )
+    
+    # 系统组件状态分类（SystemChecker 使用 warning/critical，兼容 degraded/unhealthy；检查异常、超时视为不健康）
+    UNHEALTHY_STATUSES = frozenset({'unhealthy', 'critical', 'failed', 'error', 'timeout'})
+    DEGRADED_STATUSES = frozenset({'degraded', 'warning'})
+    
+    # 基于总体状态的建议
+    STATUS_RECOMMENDATIONS = {
+        'critical': "系统存在关键问题，建议立即停止生产使用并进行修复",
+        'failed': "系统存在重要问题，建议在修复后再投入生产使用",
+        'warning': "系统基本可用，但建议优化警告项目以提升稳定性",
+        'passed': "系统验证通过，可以投入生产使用"
+    }
+    
+    # 通用建议
+    GENERAL_RECOMMENDATIONS = (
+        "建议定期进行MVP验证以确保系统持续健康",
+        "建议建立性能监控和告警机制",
+        "建议制定系统容量规划和扩展策略",
+        "建议定期备份关键数据和配置"
+    )
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         
@@ -69,6 +239,16 @@ class MVPValidationRunner:
             'fail_on_critical_issues': True,
             'save_results': True,
             'results_directory': 'validation_results',
+            # 各阶段单项调用（单个验证、检查、测试套件、优化分析）的超时（秒）
+            'phase_timeouts': {
+                'mvp': 60,
+                'performance': 60,
+                'health': 30,
+                'benchmark': 300,
+                'optimize': 120
+            },
+            'perf_min_samples': 5,       # 性能分析所需的最少监控样本数
+            'perf_sample_timeout': 30,   # 等待性能样本的最长时间（秒）
             'validation_criteria': {
                 'min_success_rate': 0.95,
                 'max_response_time': 2.0,
@@ -87,17 +267,8 @@ class MVPValidationRunner:
         if 'mvp_validation' in config:
             self.validation_config.update(config['mvp_validation'])
         
-        # 初始化组件
-        self.mvp_validator = MVPValidator(config)
-        self.performance_analyzer = PerformanceAnalyzer(config)
-        self.system_checker = SystemChecker(config)
-        self.benchmark_runner = BenchmarkRunner(config)
-        
-        # 优化器
-        self.database_optimizer = DatabaseOptimizer(config)
-        self.cache_manager = CacheManager(config)
-        self.memory_optimizer = MemoryOptimizer(config)
-        self.config_tuner = ConfigTuner(config)
+        # 验证组件和优化器在首次使用时才导入、创建（见下方属性），
+        # 未启用的阶段不产生导入和初始化开销
         
         # 确保结果目录存在
         os.makedirs(self.validation_config['results_directory'], exist_ok=True)
@@ -109,37 +280,40 @@ class MVPValidationRunner:
         result = ValidationResult()
         
         try:
-            # 1. MVP基础验证
-            if self.validation_config['run_full_validation']:
-                logger.info("执行MVP基础验证...")
-                result.mvp_validation = await self._run_mvp_validation()
-            
-            # 2. 性能分析
-            if self.validation_config['run_performance_analysis']:
-                logger.info("执行性能分析...")
-                result.performance_analysis = await self._run_performance_analysis()
-            
-            # 3. 系统健康检查
-            if self.validation_config['run_system_health_check']:
-                logger.info("执行系统健康检查...")
-                result.system_health = await self._run_system_health_check()
-            
-            # 4. 基准测试
-            if self.validation_config['run_benchmarks']:
-                logger.info("执行基准测试...")
-                result.benchmark_results = await self._run_benchmarks()
-            
-            # 5. 生成优化建议
-            if self.validation_config['generate_optimization_suggestions']:
-                logger.info("生成优化建议...")
-                result.optimization_suggestions = await self._generate_optimization_suggestions()
-            
-            # 6. 分析总体状态
-            result.overall_status = self._analyze_overall_status(result)
-            
-            # 7. 生成关键问题和建议
-            result.critical_issues = self._extract_critical_issues(result)
-            result.warnings = self._extract_warnings(result)
+            # 1-5. MVP基础验证、性能分析、系统健康检查、基准测试、优化建议
+            # 各阶段互不依赖，并发执行，总耗时取决于最慢的阶段
+            phases = [
+                (attr, label, phase_func)
+                for flag, attr, label, phase_func in (
+                    ('run_full_validation', 'mvp_validation', "MVP基础验证", self._run_mvp_validation),
+                    ('run_performance_analysis', 'performance_analysis', "性能分析", self._run_performance_analysis),
+                    ('run_system_health_check', 'system_health', "系统健康检查", self._run_system_health_check),
+                    ('run_benchmarks', 'benchmark_results', "基准测试",
+                     partial(self._run_benchmarks, result.timestamp)),
+                    ('generate_optimization_suggestions', 'optimization_suggestions', "生成优化建议",
+                     self._generate_optimization_suggestions),
+                )
+                if self.validation_config[flag]
+            ]
+            
+            logger.info(f"并发执行验证阶段: {', '.join(label for _, label, _ in phases)}")
+            phase_results = await asyncio.gather(
+                *(phase_func() for _, _, phase_func in phases), return_exceptions=True
+            )
+            
+            for (attr, label, _), phase_result in zip(phases, phase_results):
+                if isinstance(phase_result, Exception):
+                    logger.error(f"{label}失败: {phase_result}")
+                    phase_result = {
+                        'status': 'failed',
+                        'error': str(phase_result)
+                    }
+                setattr(result, attr, phase_result)
+            
+            # 6. 分析总体状态，提取关键问题和警告（一次遍历各阶段结果）
+            result.overall_status, result.critical_issues, result.warnings = self._summarize(result)
+            
+            # 7. 生成建议
             result.recommendations = self._generate_recommendations(result)
             
             # 8. 保存结果
@@ -163,28 +337,78 @@ class MVPValidationRunner:
         
         return result
     
+    @cached_property
+    def mvp_validator(self):
+        """MVP验证器（首次使用时创建）"""
+        from src.validation import MVPValidator
+        return MVPValidator(self.config)
+    
+    @cached_property
+    def performance_analyzer(self):
+        """性能分析器（首次使用时创建）"""
+        from src.validation import PerformanceAnalyzer
+        return PerformanceAnalyzer(self.config)
+    
+    @cached_property
+    def system_checker(self):
+        """系统检查器（首次使用时创建）"""
+        from src.validation import SystemChecker
+        return SystemChecker(self.config)
+    
+    @cached_property
+    def benchmark_runner(self):
+        """基准测试运行器（首次使用时创建）"""
+        from src.validation import BenchmarkRunner
+        return BenchmarkRunner(self.config)
+    
+    @cached_property
+    def database_optimizer(self):
+        """数据库优化器（首次使用时创建）"""
+        from src.optimization import DatabaseOptimizer
+        return DatabaseOptimizer(self.config)
+    
+    @cached_property
+    def cache_manager(self):
+        """缓存管理器（首次使用时创建）"""
+        from src.optimization import CacheManager
+        return CacheManager(self.config)
+    
+    @cached_property
+    def memory_optimizer(self):
+        """内存优化器（首次使用时创建）"""
+        from src.optimization import MemoryOptimizer
+        return MemoryOptimizer(self.config)
+    
+    @cached_property
+    def config_tuner(self):
+        """配置调优器（首次使用时创建）"""
+        from src.optimization import ConfigTuner
+        return ConfigTuner(self.config)
+    
+    def _phase_timeout(self, phase: str) -> Optional[float]:
+        """获取阶段单项调用的超时（秒），未配置时不限时"""
+        return self.validation_config.get('phase_timeouts', {}).get(phase)
+    
     async def _run_mvp_validation(self) -> Dict[str, Any]:
         """运行MVP验证"""
         try:
-            # 技术指标验证
-            technical_results = await self.mvp_validator.validate_technical_metrics()
-            
-            # 业务指标验证
-            business_results = await self.mvp_validator.validate_business_metrics()
-            
-            # 稳定性验证
-            stability_results = await self.mvp_validator.validate_stability()
-            
-            # 用户体验验证
-            ux_results = await self.mvp_validator.validate_user_experience()
-            
-            return {
-                'technical_metrics': technical_results,
-                'business_metrics': business_results,
-                'stability': stability_results,
-                'user_experience': ux_results,
-                'status': 'completed'
-            }
+            # 技术、业务、稳定性、用户体验验证各自产生独立的结果，并发执行
+            validator = self.mvp_validator
+            results = await _gather_named({
+                'technical_metrics': validator.validate_technical_metrics(),
+                'business_metrics': validator.validate_business_metrics(),
+                'stability': validator.validate_stability(),
+                'user_experience': validator.validate_user_experience()
+            }, "MVP验证", timeout=self._phase_timeout('mvp'))
+            
+            # 任一子验证失败或超时，整个阶段按失败处理
+            failed = _failed_entries(results)
+            if failed:
+                results['status'] = 'failed'
+                results['error'] = f"子验证失败或超时: {', '.join(failed)}"
+            else:
+                results['status'] = 'completed'
+            return results
             
         except Exception as e:
             logger.error(f"MVP验证失败: {e}")
@@ -199,28 +423,40 @@ class MVPValidationRunner:
             # 启动性能监控
             await self.performance_analyzer.start_monitoring()
             
-            # 等待收集足够的数据
-            await asyncio.sleep(30)
-            
-            # 获取性能指标
-            metrics = await self.performance_analyzer.get_current_metrics()
-            
-            # 分析性能瓶颈
-            bottlenecks = await self.performance_analyzer.analyze_bottlenecks()
-            
-            # 生成性能报告
-            report = self.performance_analyzer.generate_performance_report()
-            
-            # 停止监控
-            await self.performance_analyzer.stop_monitoring()
+            try:
+                # 等待收集足够的数据：分析器支持 wait_for_samples 时采样数足够即继续，
+                # 否则按 perf_sample_timeout 固定等待
+                await self._wait_for_performance_samples()
+                
+                timeout = self._phase_timeout('performance')
+                
+                # 获取性能指标
+                metrics = await asyncio.wait_for(self.performance_analyzer.get_current_metrics(), timeout)
+                
+                # 分析性能瓶颈
+                bottlenecks = await asyncio.wait_for(self.performance_analyzer.analyze_bottlenecks(), timeout)
+                
+                # 生成性能报告
+                report = self.performance_analyzer.generate_performance_report()
+            finally:
+                # 停止监控（超时、异常时同样停止）
+                await self.performance_analyzer.stop_monitoring()
             
             return {
                 'metrics': metrics,
                 'bottlenecks': bottlenecks,
+                'bottlenecks_by_severity': _group_by_severity(bottlenecks),
                 'report': report,
                 'status': 'completed'
             }
             
+        except asyncio.TimeoutError:
+            timeout = self._phase_timeout('performance')
+            logger.error(f"性能分析超时（{timeout}秒）")
+            return {
+                'status': 'timeout',
+                'error': f"超时（{timeout}秒）"
+            }
         except Exception as e:
             logger.error(f"性能分析失败: {e}")
             return {
@@ -228,36 +464,38 @@ class MVPValidationRunner:
                 'error': str(e)
             }
     
+    async def _wait_for_performance_samples(self):
+        """等待性能监控收集到足够的样本（最长 perf_sample_timeout 秒）"""
+        timeout = self.validation_config['perf_sample_timeout']
+        wait_for_samples = getattr(self.performance_analyzer, 'wait_for_samples', None)
+        if wait_for_samples is None:
+            await asyncio.sleep(timeout)
+            return
+        
+        try:
+            await asyncio.wait_for(
+                wait_for_samples(min_count=self.validation_config['perf_min_samples']),
+                timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"等待性能样本超时（{timeout}秒），使用已收集的数据")
+    
     async def _run_system_health_check(self) -> Dict[str, Any]:
         """运行系统健康检查"""
         try:
-            # 数据库检查
-            db_health = await self.system_checker.check_database_health()
-            
-            # Web服务检查
-            web_health = await self.system_checker.check_web_service_health()
-            
-            # 数据源检查
-            datasource_health = await self.system_checker.check_data_source_health()
-            
-            # 文件系统检查
-            filesystem_health = await self.system_checker.check_filesystem_health()
-            
-            # 网络检查
-            network_health = await self.system_checker.check_network_health()
-            
-            # 服务检查
-            service_health = await self.system_checker.check_service_health()
-            
-            return {
-                'database': db_health,
-                'web_service': web_health,
-                'data_sources': datasource_health,
-                'filesystem': filesystem_health,
-                'network': network_health,
-                'services': service_health,
-                'status': 'completed'
-            }
+            # 各项检查是独立的探测，并发执行，单项超时记为 timeout 状态
+            checker = self.system_checker
+            health = await _gather_named({
+                'database': checker.check_database_health(),
+                'web_service': checker.check_web_service_health(),
+                'data_sources': checker.check_data_source_health(),
+                'filesystem': checker.check_filesystem_health(),
+                'network': checker.check_network_health(),
+                'services': checker.check_service_health()
+            }, "系统健康检查", timeout=self._phase_timeout('health'))
+            
+            health['status'] = 'completed'
+            return health
             
         except Exception as e:
             logger.error(f"系统健康检查失败: {e}")
@@ -266,27 +504,44 @@ class MVPValidationRunner:
                 'error': str(e)
             }
     
-    async def _run_benchmarks(self) -> Dict[str, Any]:
-        """运行基准测试"""
+    async def _run_benchmarks(self, timestamp: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        运行基准测试
+        
+        Args:
+            timestamp: 所属验证的时间，用于明细文件命名（与验证结果文件一致），默认取当前时间
+        """
         try:
-            results = {}
-            
-            for suite in self.validation_config['benchmark_suites']:
-                logger.info(f"运行基准测试套件: {suite}")
-                
-                if suite == 'data_processing':
-                    results[suite] = await self.benchmark_runner.run_data_processing_benchmark()
-                elif suite == 'trading_operations':
-                    results[suite] = await self.benchmark_runner.run_trading_benchmark()
-                elif suite == 'database_operations':
-                    results[suite] = await self.benchmark_runner.run_database_benchmark()
-                elif suite == 'cache_operations':
-                    results[suite] = await self.benchmark_runner.run_cache_benchmark()
+            # 各测试套件涉及不同子系统，互不依赖，并发运行
+            suites = [
+                suite for suite in self.validation_config['benchmark_suites']
+                if suite in self.BENCHMARK_METHODS
+            ]
+            logger.info(f"运行基准测试套件: {', '.join(suites)}")
             
-            return {
+            # 保存结果时，各套件完成后立即将完整结果追加到明细文件（JSON Lines），
+            # 内存中只保留摘要字段
+            details_path = None
+            if self.validation_config['save_results']:
+                if timestamp is None:
+                    timestamp = datetime.now()
+                details_path = os.path.join(
+                    self.validation_config['results_directory'],
+                    f"benchmark_details_{timestamp.strftime('%Y%m%d_%H%M%S')}.jsonl"
+                )
+            
+            results = await _gather_named({
+                suite: self._run_benchmark_suite(suite, details_path)
+                for suite in suites
+            }, "基准测试套件", timeout=self._phase_timeout('benchmark'))
+            
+            benchmark_results = {
                 'results': results,
                 'status': 'completed'
             }
+            if details_path is not None and os.path.exists(details_path):
+                benchmark_results['details_file'] = details_path
+            return benchmark_results
             
         except Exception as e:
             logger.error(f"基准测试失败: {e}")
@@ -295,30 +550,30 @@ class MVPValidationRunner:
                 'error': str(e)
             }
     
+    async def _run_benchmark_suite(self, suite: str, details_path: Optional[str]) -> Any:
+        """运行单个基准测试套件；指定明细文件时写入完整结果，返回摘要"""
+        suite_result = await getattr(self.benchmark_runner, self.BENCHMARK_METHODS[suite])()
+        if hasattr(suite_result, 'to_dict'):
+            suite_result = suite_result.to_dict()
+        if details_path is None or not isinstance(suite_result, dict):
+            return suite_result
+        
+        line = _json_dumps_line({'suite': suite, 'result': suite_result})
+        await asyncio.get_event_loop().run_in_executor(None, _append_bytes, details_path, line)
+        
+        return {key: suite_result[key] for key in self.BENCHMARK_SUMMARY_FIELDS if key in suite_result}
+    
     async def _generate_optimization_suggestions(self) -> Dict[str, Any]:
         """生成优化建议"""
         try:
-            suggestions = {}
-            
-            # 数据库优化建议
-            logger.info("分析数据库优化机会...")
-            db_suggestions = await self.database_optimizer.analyze_and_optimize()
-            suggestions['database'] = db_suggestions
-            
-            # 缓存优化建议
-            logger.info("分析缓存优化机会...")
-            cache_suggestions = await self.cache_manager.optimize_cache_strategy()
-            suggestions['cache'] = cache_suggestions
-            
-            # 内存优化建议
-            logger.info("分析内存优化机会...")
-            memory_suggestions = await self.memory_optimizer.analyze_and_optimize()
-            suggestions['memory'] = memory_suggestions
-            
-            # 配置优化建议
-            logger.info("分析配置优化机会...")
-            config_suggestions = await self.config_tuner.analyze_and_optimize()
-            suggestions['config'] = config_suggestions
+            # 数据库、缓存、内存、配置优化分析针对不同资源，并发执行
+            logger.info("分析数据库、缓存、内存、配置优化机会...")
+            suggestions = await _gather_named({
+                'database': self.database_optimizer.analyze_and_optimize(),
+                'cache': self.cache_manager.optimize_cache_strategy(),
+                'memory': self.memory_optimizer.analyze_and_optimize(),
+                'config': self.config_tuner.analyze_and_optimize()
+            }, "优化分析", timeout=self._phase_timeout('optimize'))
             
             return {
                 'suggestions': suggestions,
@@ -332,18 +587,27 @@ class MVPValidationRunner:
                 'error': str(e)
             }
     
-    def _analyze_overall_status(self, result: ValidationResult) -> str:
-        """分析总体状态"""
+    def _summarize(self, result: ValidationResult) -> Tuple[str, List[str], List[str]]:
+        """
+        汇总验证结果
+        
+        一次遍历各阶段结果，同时得出总体状态、关键问题和警告
+        
+        Returns:
+            (总体状态, 关键问题列表, 警告列表)
+        """
+        criteria = self.validation_config['validation_criteria']
+        issues = []             # 判定总体状态的问题
+        critical_issues = []
+        warnings = []
+        
         try:
-            criteria = self.validation_config['validation_criteria']
-            issues = []
-            warnings = []
-            
-            # 检查MVP验证结果
+            # MVP验证结果
             if result.mvp_validation and result.mvp_validation.get('status') == 'failed':
                 issues.append("MVP基础验证失败")
+                critical_issues.append("MVP基础验证失败")
             
-            # 检查性能指标
+            # 性能指标和性能瓶颈
             if result.performance_analysis and result.performance_analysis.get('status') == 'completed':
                 metrics = result.performance_analysis.get('metrics', {})
                 
@@ -356,14 +620,32 @@ class MVPValidationRunner:
                 error_rate = metrics.get('error_rate', 0)
                 if error_rate > criteria['max_error_rate']:
                     issues.append(f"错误率过高: {error_rate:.2%} > {criteria['max_error_rate']:.2%}")
-            
-            # 检查系统健康
+                
+                # 性能瓶颈在性能分析阶段已按严重程度分组，直接读取对应分组
+                by_severity = result.performance_analysis.get('bottlenecks_by_severity')
+                if by_severity is None:
+                    by_severity = _group_by_severity(result.performance_analysis.get('bottlenecks', []))
+                critical_issues.extend(
+                    f"关键性能瓶颈: {b.get('description', '')}" for b in by_severity.get('critical', ())
+                )
+                warnings.extend(
+                    f"性能警告: {b.get('description', '')}" for b in by_severity.get('warning', ())
+                )
+            
+            # 系统健康
             if result.system_health and result.system_health.get('status') == 'completed':
                 for component, health in result.system_health.items():
-                    if isinstance(health, dict) and health.get('status') == 'unhealthy':
+                    if not isinstance(health, dict):
+                        continue
+                    status = health.get('status')
+                    if status in self.UNHEALTHY_STATUSES:
                         issues.append(f"系统组件不健康: {component}")
+                        if health.get('severity') == 'critical':
+                            critical_issues.append(f"关键系统组件故障: {component}")
+                    elif status in self.DEGRADED_STATUSES:
+                        warnings.append(f"系统组件性能下降: {component}")
             
-            # 检查基准测试
+            # 基准测试
             if result.benchmark_results and result.benchmark_results.get('status') == 'completed':
                 benchmark_results = result.benchmark_results.get('results', {})
                 for suite, suite_result in benchmark_results.items():
@@ -372,185 +654,100 @@ class MVPValidationRunner:
                         if success_rate < criteria['min_success_rate']:
                             issues.append(f"基准测试 {suite} 成功率过低: {success_rate:.2%}")
             
+            # 优化建议中的警告
+            if result.optimization_suggestions and result.optimization_suggestions.get('status') == 'completed':
+                suggestions = result.optimization_suggestions.get('suggestions', {})
+                for category, category_suggestions in suggestions.items():
+                    if isinstance(category_suggestions, dict):
+                        warnings.extend(f"{category}: {w}" for w in category_suggestions.get('warnings', []))
+            
             # 判断总体状态
             if issues:
                 if len(issues) >= 3 or any("失败" in issue for issue in issues):
-                    return "critical"
+                    status = "critical"
                 else:
-                    return "failed"
-            elif warnings:
-                return "warning"
+                    status = "failed"
             else:
-                return "passed"
+                status = "passed"
                 
         except Exception as e:
-            logger.error(f"分析总体状态失败: {e}")
-            return "unknown"
-    
-    def _extract_critical_issues(self, result: ValidationResult) -> List[str]:
-        """提取关键问题"""
-        issues = []
-        
-        try:
-            # MVP验证问题
-            if result.mvp_validation and result.mvp_validation.get('status') == 'failed':
-                issues.append("MVP基础验证失败")
-            
-            # 性能问题
-            if result.performance_analysis and result.performance_analysis.get('status') == 'completed':
-                bottlenecks = result.performance_analysis.get('bottlenecks', [])
-                critical_bottlenecks = [b for b in bottlenecks if b.get('severity') == 'critical']
-                for bottleneck in critical_bottlenecks:
-                    issues.append(f"关键性能瓶颈: {bottleneck.get('description', '')}")
-            
-            # 系统健康问题
-            if result.system_health and result.system_health.get('status') == 'completed':
-                for component, health in result.system_health.items():
-                    if isinstance(health, dict) and health.get('status') == 'unhealthy':
-                        if health.get('severity') == 'critical':
-                            issues.append(f"关键系统组件故障: {component}")
-            
-        except Exception as e:
-            logger.error(f"提取关键问题失败: {e}")
-            issues.append(f"问题分析异常: {str(e)}")
+            logger.error(f"汇总验证结果失败: {e}")
+            status = "unknown"
+            critical_issues.append(f"问题分析异常: {str(e)}")
         
-        return issues
-    
-    def _extract_warnings(self, result: ValidationResult) -> List[str]:
-        """提取警告"""
-        warnings = []
-        
-        try:
-            # 性能警告
-            if result.performance_analysis and result.performance_analysis.get('status') == 'completed':
-                bottlenecks = result.performance_analysis.get('bottlenecks', [])
-                warning_bottlenecks = [b for b in bottlenecks if b.get('severity') == 'warning']
-                for bottleneck in warning_bottlenecks:
-                    warnings.append(f"性能警告: {bottleneck.get('description', '')}")
-            
-            # 系统健康警告
-            if result.system_health and result.system_health.get('status') == 'completed':
-                for component, health in result.system_health.items():
-                    if isinstance(health, dict) and health.get('status') == 'degraded':
-                        warnings.append(f"系统组件性能下降: {component}")
-            
-            # 优化建议中的警告
-            if result.optimization_suggestions and result.optimization_suggestions.get('status') == 'completed':
-                suggestions = result.optimization_suggestions.get('suggestions', {})
-                for category, category_suggestions in suggestions.items():
-                    if isinstance(category_suggestions, dict):
-                        category_warnings = category_suggestions.get('warnings', [])
-                        warnings.extend([f"{category}: {w}" for w in category_warnings])
-        
-        except Exception as e:
-            logger.error(f"提取警告失败: {e}")
-        
-        return warnings
+        return status, critical_issues, warnings
     
     def _generate_recommendations(self, result: ValidationResult) -> List[str]:
         """生成建议"""
-        recommendations = []
-        
         try:
             # 基于总体状态的建议
-            if result.overall_status == "critical":
-                recommendations.append("系统存在关键问题，建议立即停止生产使用并进行修复")
-            elif result.overall_status == "failed":
-                recommendations.append("系统存在重要问题，建议在修复后再投入生产使用")
-            elif result.overall_status == "warning":
-                recommendations.append("系统基本可用，但建议优化警告项目以提升稳定性")
-            elif result.overall_status == "passed":
-                recommendations.append("系统验证通过，可以投入生产使用")
+            status_recommendation = self.STATUS_RECOMMENDATIONS.get(result.overall_status)
             
             # 优化建议
+            optimization_recommendations = ()
             if result.optimization_suggestions and result.optimization_suggestions.get('status') == 'completed':
                 suggestions = result.optimization_suggestions.get('suggestions', {})
-                for category, category_suggestions in suggestions.items():
-                    if isinstance(category_suggestions, dict):
-                        category_recommendations = category_suggestions.get('recommendations', [])
-                        recommendations.extend([f"{category}优化: {r}" for r in category_recommendations])
-            
-            # 通用建议
-            recommendations.extend([
-                "建议定期进行MVP验证以确保系统持续健康",
-                "建议建立性能监控和告警机制",
-                "建议制定系统容量规划和扩展策略",
-                "建议定期备份关键数据和配置"
-            ])
+                optimization_recommendations = (
+                    f"{category}优化: {r}"
+                    for category, category_suggestions in suggestions.items()
+                    if isinstance(category_suggestions, dict)
+                    for r in category_suggestions.get('recommendations', [])
+                )
+            
+            # 状态建议、优化建议、通用建议依次拼接，一次生成结果列表
+            return list(chain(
+                (status_recommendation,) if status_recommendation else (),
+                optimization_recommendations,
+                self.GENERAL_RECOMMENDATIONS
+            ))
         
         except Exception as e:
             logger.error(f"生成建议失败: {e}")
-        
-        return recommendations
+            return []
     
     async def _save_results(self, result: ValidationResult):
         """保存验证结果"""
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"mvp_validation_{timestamp}.json"
+            # 文件名使用结果自身的时间戳，与结果内容中的时间一致
+            filename = f"mvp_validation_{result.timestamp.strftime('%Y%m%d_%H%M%S')}.json"
             filepath = os.path.join(self.validation_config['results_directory'], filename)
+            latest_filepath = os.path.join(self.validation_config['results_directory'], "latest_validation.json")
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(result.to_dict(), f, indent=2, ensure_ascii=False)
+            # 序列化和文件写入放到线程池执行，避免阻塞事件循环；结果只序列化一次
+            loop = asyncio.get_event_loop()
+            payload = await loop.run_in_executor(None, result.to_json)
+            await loop.run_in_executor(None, _write_results, filepath, latest_filepath, payload)
             
             logger.info(f"验证结果已保存到: {filepath}")
             
-            # 同时保存最新结果
-            latest_filepath = os.path.join(self.validation_config['results_directory'], "latest_validation.json")
-            with open(latest_filepath, 'w', encoding='utf-8') as f:
-                json.dump(result.to_dict(), f, indent=2, ensure_ascii=False)
-            
         except Exception as e:
             logger.error(f"保存验证结果失败: {e}")
     
     def generate_summary_report(self, result: ValidationResult) -> str:
         """生成摘要报告"""
-        report_lines = [
-            "=" * 60,
-            "MVP验证摘要报告",
-            "=" * 60,
-            f"验证时间: {result.timestamp.strftime('%Y-%m-%d %H:%M:%S')}",
-            f"总体状态: {result.overall_status.upper()}",
-            ""
-        ]
-        
-        # 关键问题
-        if result.critical_issues:
-            report_lines.extend([
-                "关键问题:",
-                "-" * 20
-            ])
-            for issue in result.critical_issues:
-                report_lines.append(f"• {issue}")
-            report_lines.append("")
+        buf = io.StringIO()
+        write = buf.write
         
-        # 警告
-        if result.warnings:
-            report_lines.extend([
-                "警告:",
-                "-" * 20
-            ])
-            for warning in result.warnings[:5]:  # 只显示前5个警告
-                report_lines.append(f"• {warning}")
-            if len(result.warnings) > 5:
-                report_lines.append(f"... 还有 {len(result.warnings) - 5} 个警告")
-            report_lines.append("")
+        write(f"{_REPORT_RULE}\nMVP验证摘要报告\n{_REPORT_RULE}\n"
+              f"验证时间: {result.timestamp.strftime('%Y-%m-%d %H:%M:%S')}\n"
+              f"总体状态: {result.overall_status.upper()}\n\n")
         
-        # 建议
-        if result.recommendations:
-            report_lines.extend([
-                "建议:",
-                "-" * 20
-            ])
-            for recommendation in result.recommendations[:5]:  # 只显示前5个建议
-                report_lines.append(f"• {recommendation}")
-            if len(result.recommendations) > 5:
-                report_lines.append(f"... 还有 {len(result.recommendations) - 5} 个建议")
-            report_lines.append("")
+        # 关键问题全部显示，警告和建议只显示前5条
+        for title, items, limit in (("关键问题", result.critical_issues, None),
+                                    ("警告", result.warnings, 5),
+                                    ("建议", result.recommendations, 5)):
+            if not items:
+                continue
+            write(f"{title}:\n{_SECTION_RULE}\n")
+            for item in items[:limit]:
+                write(f"• {item}\n")
+            if limit is not None and len(items) > limit:
+                write(f"... 还有 {len(items) - limit} 个{title}\n")
+            write("\n")
         
-        report_lines.append("=" * 60)
+        write(_REPORT_RULE)
         
-        return "\n".join(report_lines)
+        return buf.getvalue()
 
 
 async def main():
@@ -591,8 +788,7 @@ async def main():
         
         # 保存结果到指定文件
         if args.output:
-            with open(args.output, 'w', encoding='utf-8') as f:
-                json.dump(result.to_dict(), f, indent=2, ensure_ascii=False)
+            _write_bytes(args.output, result.to_json())
             print(f"\n详细结果已保存到: {args.output}")
         
         # 根据验证结果设置退出码
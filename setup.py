@@ -3,7 +3,7 @@
 量化交易系统安装配置文件
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
 import os
 
 # 读取README文件
@@ -34,6 +34,21 @@ def get_version():
         pass
     return "1.0.0"
 
+# 可选的 Cython 扩展（未安装 Cython 时跳过，运行时退化为 numba/NumPy 实现）
+def get_ext_modules():
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        return []
+    extensions = [
+        Extension(
+            "risk._scan",
+            ["src/risk/_scan.pyx"],
+            extra_compile_args=["-O3"],
+        ),
+    ]
+    return cythonize(extensions, language_level=3)
+
 setup(
     name="lianghua-trading-system",
     version=get_version(),
@@ -47,6 +62,7 @@ setup(
     # 包配置
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    ext_modules=get_ext_modules(),
     
     # 包含非Python文件
     include_package_data=True,
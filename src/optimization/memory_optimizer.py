@@ -5,6 +5,7 @@
 """
 
 import asyncio
+import bisect
 import gc
 import logging
 import psutil
@@ -18,12 +19,17 @@ from collections import defaultdict
 
 logger = logging.getLogger(__name__)
 
+# 泄漏严重程度分级阈值（字节）：1MB / 10MB / 100MB
+_SEVERITY_THRESHOLDS = (1 << 20, 10 << 20, 100 << 20)
+_SEVERITY_NAMES = ('low', 'medium', 'high', 'critical')
+
 
 class MemorySnapshot:
     """内存快照"""
     
     def __init__(self):
-        self.timestamp = datetime.now()
+        # 仅记录整数纳秒时间戳，导出时再转换为 datetime
+        self.timestamp_ns = time.time_ns()
         self.total_memory = 0
         self.available_memory = 0
         self.process_memory = 0
@@ -32,6 +38,11 @@ class MemorySnapshot:
         self.object_counts = {}
         self.largest_objects = []
     
+    @property
+    def timestamp(self) -> datetime:
+        """快照时间"""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
+    
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典格式"""
         return {
@@ -53,19 +64,18 @@ class MemoryLeak:
         self.object_type = object_type
         self.count_growth = count_growth
         self.size_growth = size_growth
-        self.detected_at = datetime.now()
+        self.detected_at_ns = time.time_ns()
         self.severity = self._calculate_severity()
     
+    @property
+    def detected_at(self) -> datetime:
+        """检测时间"""
+        return datetime.fromtimestamp(self.detected_at_ns / 1e9)
+    
     def _calculate_severity(self) -> str:
         """计算严重程度"""
-        if self.size_growth > 100 * 1024 * 1024:  # 100MB
-            return 'critical'
-        elif self.size_growth > 10 * 1024 * 1024:  # 10MB
-            return 'high'
-        elif self.size_growth > 1024 * 1024:  # 1MB
-            return 'medium'
-        else:
-            return 'low'
+        # 阈值本身归入低一级，与 ">" 判断保持一致
+        return _SEVERITY_NAMES[bisect.bisect_left(_SEVERITY_THRESHOLDS, self.size_growth)]
     
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典格式"""
@@ -101,7 +111,8 @@ class MemoryOptimizer:
             'object_tracking': {
                 'enabled': True,
                 'track_types': ['dict', 'list', 'tuple', 'set'],
-                'max_tracked_objects': 1000
+                'max_tracked_objects': 1000,
+                'rss_growth_threshold': 0.05  # RSS超过高水位5%才重新遍历对象
             },
             'memory_limits': {
                 'max_memory_percent': 80.0,  # 最大内存使用百分比
@@ -119,9 +130,15 @@ class MemoryOptimizer:
         self.detected_leaks = []
         self.monitoring = False
         self.monitor_thread = None
+        self._stop_event = threading.Event()
+        self._err_streak = 0
         self.object_tracker = weakref.WeakSet()
         self.gc_stats_history = []
         
+        # 对象遍历采样：仅当RSS突破高水位时才执行 gc.get_objects() 全量遍历
+        self._proc = psutil.Process()
+        self._rss_high_water = 0
+        
         # 初始化
         self._init_monitoring()
     
@@ -136,6 +153,8 @@ class MemoryOptimizer:
             return
         
         self.monitoring = True
+        self._stop_event.clear()
+        self._err_streak = 0
         self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self.monitor_thread.start()
         logger.info("内存监控已启动")
@@ -143,6 +162,7 @@ class MemoryOptimizer:
     def stop_monitoring(self):
         """停止内存监控"""
         self.monitoring = False
+        self._stop_event.set()
         if self.monitor_thread:
             self.monitor_thread.join(timeout=5)
         logger.info("内存监控已停止")
@@ -164,11 +184,14 @@ class MemoryOptimizer:
                 # 检查内存使用是否过高
                 self._check_memory_usage(snapshot)
                 
-                time.sleep(self.optimization_config['monitoring']['interval'])
+                self._err_streak = 0
+                self._stop_event.wait(self.optimization_config['monitoring']['interval'])
                 
             except Exception as e:
                 logger.error(f"内存监控异常: {e}")
-                time.sleep(5)
+                # 指数退避（5s起，最长300s），停止时立即唤醒
+                self._err_streak += 1
+                self._stop_event.wait(min(5 * 2 ** (self._err_streak - 1), 300))
     
     def _take_memory_snapshot(self) -> MemorySnapshot:
         """获取内存快照"""
@@ -182,9 +205,8 @@ class MemoryOptimizer:
             snapshot.memory_percent = memory_info.percent
             
             # 进程内存信息
-            process = psutil.Process()
-            process_memory = process.memory_info()
-            snapshot.process_memory = process_memory.rss
+            rss = self._proc.memory_info().rss
+            snapshot.process_memory = rss
             
             # 垃圾收集统计
             snapshot.gc_stats = {
@@ -194,9 +216,18 @@ class MemoryOptimizer:
             }
             
             # 对象计数
-            if self.optimization_config['object_tracking']['enabled']:
-                snapshot.object_counts = self._get_object_counts()
-                snapshot.largest_objects = self._get_largest_objects()
+            tracking_config = self.optimization_config['object_tracking']
+            if tracking_config['enabled']:
+                growth_threshold = tracking_config.get('rss_growth_threshold', 0.05)
+                if self.snapshots and rss < self._rss_high_water * (1 + growth_threshold):
+                    # RSS未明显增长，沿用上一次的遍历结果
+                    previous = self.snapshots[-1]
+                    snapshot.object_counts = previous.object_counts
+                    snapshot.largest_objects = previous.largest_objects
+                else:
+                    self._rss_high_water = max(self._rss_high_water, rss)
+                    snapshot.object_counts = self._get_object_counts()
+                    snapshot.largest_objects = self._get_largest_objects()
             
         except Exception as e:
             logger.error(f"获取内存快照失败: {e}")
@@ -17,11 +17,25 @@
 - RiskMonitor: 风控监控
 """
 
-from .risk_config import RiskConfig, RiskLevel, RiskEvent
-from .base_risk import BaseRiskManager, RiskCheckResult, RiskViolation
-from .position_manager import PositionManager, PositionLimits
-from .money_manager import MoneyManager, FundAllocation
-from .risk_monitor import RiskMonitor, RiskAlert
+import importlib
+
+# 公开名称 -> 所在子模块，首次访问时才导入（PEP 562）
+_LAZY_IMPORTS = {
+    'RiskConfig': 'risk_config',
+    'RiskLevel': 'risk_config',
+    'RiskEvent': 'risk_config',
+    'RiskConfigSnapshot': 'risk_config',
+    'BaseRiskManager': 'base_risk',
+    'RiskCheckResult': 'base_risk',
+    'RiskViolation': 'base_risk',
+    'PortfolioArrays': 'base_risk',
+    'PositionManager': 'position_manager',
+    'PositionLimits': 'position_manager',
+    'MoneyManager': 'money_manager',
+    'FundAllocation': 'money_manager',
+    'RiskMonitor': 'risk_monitor',
+    'RiskAlert': 'risk_monitor',
+}
 
 __version__ = "1.0.0"
 __author__ = "量化交易系统"
@@ -31,11 +45,13 @@ __all__ = [
     'RiskConfig',
     'RiskLevel', 
     'RiskEvent',
+    'RiskConfigSnapshot',
     
     # 基础风控
     'BaseRiskManager',
     'RiskCheckResult',
     'RiskViolation',
+    'PortfolioArrays',
     
     # 仓位管理
     'PositionManager',
@@ -62,4 +78,20 @@ RISK_SYSTEM_INFO = {
         'MoneyManager - 资金管理', 
         'RiskMonitor - 风控监控'
     ]
-}
\ No newline at end of file
+}
+
+
+def __getattr__(name):
+    """按需导入子模块中的公开对象"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
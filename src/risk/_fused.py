@@ -0,0 +1,125 @@
+"""
+组合风控融合扫描内核
+====================
+
+将止损、止盈、涨跌停、波动率四类逐票规则融合为一次遍历：
+每只股票只读取一次价格数据，输出触发规则的位标志，
+由 BaseRiskManager 仅对触发的股票构造违规记录。
+
+内核选择：安装 numba 时使用 JIT 编译的循环内核（大组合按 prange 多核并行）；
+未安装 numba 时使用已编译的 Cython 扩展 _scan，都不可用时退化为等价的
+NumPy 向量表达式。
+"""
+
+import numpy as np
+
+try:
+    import numba
+    from numba import prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    numba = None
+    prange = range
+
+try:
+    from . import _scan as _cscan
+    HAS_CSCAN = True
+except ImportError:
+    HAS_CSCAN = False
+    _cscan = None
+
+# 规则触发位
+FLAG_STOP_LOSS = 1 << 0
+FLAG_STOP_PROFIT = 1 << 1
+FLAG_UP_LIMIT = 1 << 2
+FLAG_DOWN_LIMIT = 1 << 3
+FLAG_HIGH_VOL = 1 << 4
+
+# thresholds 数组下标
+TH_STOP_LOSS = 0
+TH_STOP_PROFIT = 1
+TH_PRICE_LIMIT = 2
+TH_VOLATILITY = 3
+
+# 股票数达到该值才使用并行内核，小组合下线程调度开销大于收益
+PARALLEL_MIN_SIZE = 2048
+
+
+def _scan_loop(cur, avg, prev, position, vol, thresholds):
+    """逐票循环实现（供 numba 编译，各股票互不依赖，可按 prange 并行）"""
+    n = cur.shape[0]
+    flags = np.zeros(n, dtype=np.uint8)
+    loss = np.empty(n, dtype=np.float64)
+    change = np.empty(n, dtype=np.float64)
+
+    stop_loss = thresholds[TH_STOP_LOSS]
+    stop_profit = thresholds[TH_STOP_PROFIT]
+    limit = thresholds[TH_PRICE_LIMIT]
+    vol_threshold = thresholds[TH_VOLATILITY]
+
+    for i in prange(n):
+        r1 = (avg[i] - cur[i]) / avg[i]
+        r2 = (cur[i] - prev[i]) / prev[i]
+        loss[i] = r1
+        change[i] = r2
+
+        f = 0
+        if position[i] != 0:
+            if r1 > stop_loss:
+                f |= FLAG_STOP_LOSS
+            if -r1 > stop_profit:
+                f |= FLAG_STOP_PROFIT
+        if r2 > limit:
+            f |= FLAG_UP_LIMIT
+        elif r2 < -limit:
+            f |= FLAG_DOWN_LIMIT
+        if vol[i] > vol_threshold:
+            f |= FLAG_HIGH_VOL
+        flags[i] = f
+
+    return flags, loss, change
+
+
+def _scan_numpy(cur, avg, prev, position, vol, thresholds):
+    """NumPy 向量化实现（未安装 numba 时使用）"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        loss = (avg - cur) / avg
+        change = (cur - prev) / prev
+
+    held = position != 0
+    limit = thresholds[TH_PRICE_LIMIT]
+    up = change > limit
+
+    flags = (held & (loss > thresholds[TH_STOP_LOSS])) * FLAG_STOP_LOSS
+    flags |= (held & (-loss > thresholds[TH_STOP_PROFIT])) * FLAG_STOP_PROFIT
+    flags |= up * FLAG_UP_LIMIT
+    flags |= (~up & (change < -limit)) * FLAG_DOWN_LIMIT
+    flags |= (vol > thresholds[TH_VOLATILITY]) * FLAG_HIGH_VOL
+
+    return flags.astype(np.uint8), loss, change
+
+
+if HAS_NUMBA:
+    _scan_serial = numba.njit(cache=True, error_model='numpy')(_scan_loop)
+    _scan_parallel = numba.njit(cache=True, parallel=True, error_model='numpy')(_scan_loop)
+
+
+def scan(cur, avg, prev, position, vol, thresholds):
+    """
+    融合扫描
+
+    thresholds 依次为 [止损比例, 止盈比例, 涨跌停阈值, 波动率阈值]，vol 无数据时填 NaN。
+    价格、持仓、波动率输入为同一精度（float64 或 float32）的 C 连续数组，由 PortfolioArrays 保证；
+    numba 按输入精度分别特化，float32 下比例按单精度计算。
+
+    Returns:
+        (flags, loss_ratio, change_ratio)
+    """
+    if HAS_NUMBA:
+        if cur.shape[0] >= PARALLEL_MIN_SIZE:
+            return _scan_parallel(cur, avg, prev, position, vol, thresholds)
+        return _scan_serial(cur, avg, prev, position, vol, thresholds)
+    if HAS_CSCAN:
+        return _cscan.scan(cur, avg, prev, position, vol, thresholds)
+    return _scan_numpy(cur, avg, prev, position, vol, thresholds)
@@ -0,0 +1,72 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+组合风控融合扫描内核（Cython 实现）
+==================================
+
+与 _fused._scan_loop 逻辑一致的编译版本，供未安装 numba 的环境使用
+（无需 JIT 依赖和预热）。未编译时 _fused 退化为 NumPy 实现。
+
+构建：python setup.py build_ext --inplace
+"""
+
+import numpy as np
+
+from cython cimport floating
+from libc.stdint cimport uint8_t
+
+# 与 _fused 中的触发位保持一致
+cdef enum:
+    FLAG_STOP_LOSS = 1
+    FLAG_STOP_PROFIT = 2
+    FLAG_UP_LIMIT = 4
+    FLAG_DOWN_LIMIT = 8
+    FLAG_HIGH_VOL = 16
+
+
+def scan(const floating[::1] cur, const floating[::1] avg, const floating[::1] prev,
+         const floating[::1] position, const floating[::1] vol, const double[::1] thresholds):
+    """
+    融合扫描
+
+    参数与返回值同 _fused.scan：thresholds 依次为
+    [止损比例, 止盈比例, 涨跌停阈值, 波动率阈值]，返回 (flags, loss_ratio, change_ratio)。
+    价格等输入为 float64 或 float32（同一精度），比例按输入精度计算后存为 float64
+    """
+    cdef Py_ssize_t n = cur.shape[0]
+    cdef Py_ssize_t i
+    cdef floating r1, r2
+    cdef uint8_t f
+    cdef double stop_loss = thresholds[0]
+    cdef double stop_profit = thresholds[1]
+    cdef double limit = thresholds[2]
+    cdef double vol_threshold = thresholds[3]
+
+    flags_arr = np.zeros(n, dtype=np.uint8)
+    loss_arr = np.empty(n, dtype=np.float64)
+    change_arr = np.empty(n, dtype=np.float64)
+    cdef uint8_t[::1] flags = flags_arr
+    cdef double[::1] loss = loss_arr
+    cdef double[::1] change = change_arr
+
+    with nogil:
+        for i in range(n):
+            r1 = (avg[i] - cur[i]) / avg[i]
+            r2 = (cur[i] - prev[i]) / prev[i]
+            loss[i] = r1
+            change[i] = r2
+
+            f = 0
+            if position[i] != 0:
+                if r1 > stop_loss:
+                    f |= FLAG_STOP_LOSS
+                if -r1 > stop_profit:
+                    f |= FLAG_STOP_PROFIT
+            if r2 > limit:
+                f |= FLAG_UP_LIMIT
+            elif r2 < -limit:
+                f |= FLAG_DOWN_LIMIT
+            if vol[i] > vol_threshold:
+                f |= FLAG_HIGH_VOL
+            flags[i] = f
+
+    return flags_arr, loss_arr, change_arr
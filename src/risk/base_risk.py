@@ -11,20 +11,71 @@
 - 风控规则组合和执行
 """
 
+import functools
 import logging
+import math
 import pandas as pd
 import numpy as np
 from enum import Enum
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, field
-from datetime import datetime, time, timedelta
+from typing import Dict, List, Optional, Any, Tuple, Union
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    numba = None
 
 from .risk_config import RiskConfig, RiskEvent, RiskEventType, RiskLevel
+from . import _fused
 
 logger = logging.getLogger(__name__)
 
 
+def _vol_welford_py(p: np.ndarray) -> float:
+    """单次遍历计算收益率 r[i] = p[i]/p[i-1] - 1 的样本标准差（Welford算法）"""
+    mean = 0.0
+    m2 = 0.0
+    n = 0
+    for i in range(1, p.size):
+        r = p[i] / p[i - 1] - 1.0
+        n += 1
+        d = r - mean
+        mean += d / n
+        m2 += (r - mean) * d
+    if n < 2:
+        return math.nan
+    return math.sqrt(m2 / (n - 1))
+
+
+_vol_welford = None
+if HAS_NUMBA:
+    try:
+        # error_model='numpy' 与 _fused 一致：除零得到 inf/nan 而不是抛出异常
+        _vol_welford = numba.njit(cache=True, error_model='numpy')(_vol_welford_py)
+        # 导入时预热JIT，避免首次风控检查承担编译延迟
+        _vol_welford(np.array([1.0, 1.0, 1.0]))
+    except Exception as e:  # 缓存失效或编译失败时退回pandas实现
+        logger.warning(f"波动率JIT内核不可用，使用pandas实现: {e}")
+        _vol_welford = None
+
+
+# 风险评分表，按 RiskLevel.severity 索引（LOW=1 .. CRITICAL=4）
+_RISK_SCORES = np.array([0.0, 1.0, 2.0, 5.0, 10.0], dtype=np.float64)
+_SEVERITY_MEDIUM = RiskLevel.MEDIUM.severity
+_SEVERITY_HIGH = RiskLevel.HIGH.severity
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_time(value: str) -> time:
+    """解析交易时间字符串（结果缓存，配置刷新和多个规则实例共享）"""
+    return time.fromisoformat(value)
+
+
 class RiskCheckStatus(Enum):
     """风控检查状态"""
     PASS = "pass"           # 通过
@@ -33,30 +84,91 @@ class RiskCheckStatus(Enum):
     ERROR = "error"         # 错误
 
 
-@dataclass
 class RiskViolation:
-    """风控违规记录"""
-    rule_name: str
-    violation_type: RiskEventType
-    symbol: str
-    current_value: float
-    limit_value: float
-    risk_level: RiskLevel
-    message: str
-    timestamp: datetime = field(default_factory=datetime.now)
+    """
+    风控违规记录
+    
+    批量扫描时单次检查可能产生成百上千条违规，使用 __slots__ 省去实例 __dict__；
+    timestamp 由调用方按批次传入同一时间，未传入时取当前时间。
+    
+    message 可直接传入字符串，也可传入 template 与 args，
+    在首次读取 message 时才格式化（结果缓存）。
+    """
+    __slots__ = ('rule_name', 'violation_type', 'symbol', 'current_value',
+                 'limit_value', 'risk_level', 'timestamp',
+                 '_message', '_template', '_args')
+    
+    _FIELDS = ('rule_name', 'violation_type', 'symbol', 'current_value',
+               'limit_value', 'risk_level', 'message', 'timestamp')
+    
+    def __init__(self, rule_name: str, violation_type: RiskEventType, symbol: str,
+                 current_value: float, limit_value: float, risk_level: RiskLevel,
+                 message: Optional[str] = None, timestamp: Optional[datetime] = None,
+                 template: Optional[str] = None, args: Tuple = ()):
+        if message is None and template is None:
+            raise ValueError("RiskViolation 需要 message 或 template")
+        self.rule_name = rule_name
+        self.violation_type = violation_type
+        self.symbol = symbol
+        self.current_value = current_value
+        self.limit_value = limit_value
+        self.risk_level = risk_level
+        self.timestamp = timestamp if timestamp is not None else datetime.now()
+        self._message = message
+        self._template = template
+        self._args = args
+    
+    @property
+    def message(self) -> str:
+        """违规描述（延迟格式化）"""
+        if self._message is None:
+            self._message = self._template.format(*self._args)
+        return self._message
+    
+    @message.setter
+    def message(self, value: str):
+        self._message = value
+    
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self._FIELDS)
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        fields_repr = ', '.join(f"{name}={getattr(self, name)!r}" for name in self._FIELDS)
+        return f"RiskViolation({fields_repr})"
     
     def __str__(self) -> str:
         return f"{self.rule_name}: {self.symbol} - {self.message}"
 
 
-@dataclass
 class RiskCheckResult:
     """风控检查结果"""
-    status: RiskCheckStatus
-    violations: List[RiskViolation] = field(default_factory=list)
-    warnings: List[str] = field(default_factory=list)
-    blocked_operations: List[str] = field(default_factory=list)
-    risk_score: float = 0.0
+    __slots__ = ('status', 'violations', 'warnings', 'blocked_operations', 'risk_score')
+    
+    def __init__(self, status: RiskCheckStatus,
+                 violations: Optional[List[RiskViolation]] = None,
+                 warnings: Optional[List[str]] = None,
+                 blocked_operations: Optional[List[str]] = None,
+                 risk_score: float = 0.0):
+        self.status = status
+        self.violations = violations if violations is not None else []
+        self.warnings = warnings if warnings is not None else []
+        self.blocked_operations = blocked_operations if blocked_operations is not None else []
+        self.risk_score = risk_score
+    
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        fields_repr = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"RiskCheckResult({fields_repr})"
     
     @property
     def is_pass(self) -> bool:
@@ -71,15 +183,96 @@ class RiskCheckResult:
     def add_violation(self, violation: RiskViolation):
         """添加违规记录"""
         self.violations.append(violation)
-        if violation.risk_level in [RiskLevel.HIGH, RiskLevel.CRITICAL]:
+        severity = violation.risk_level.severity
+        if severity >= _SEVERITY_HIGH:
             self.status = RiskCheckStatus.BLOCKED
             self.blocked_operations.append(violation.message)
-        elif violation.risk_level == RiskLevel.MEDIUM:
+        elif severity == _SEVERITY_MEDIUM:
             if self.status == RiskCheckStatus.PASS:
                 self.status = RiskCheckStatus.WARNING
             self.warnings.append(violation.message)
 
 
+# PortfolioArrays 支持的数值列精度
+_PORTFOLIO_DTYPES = (np.dtype(np.float64), np.dtype(np.float32))
+
+
+@dataclass
+class PortfolioArrays:
+    """
+    组合持仓列式数据（Structure-of-Arrays）
+    
+    每个字段为按股票对齐的一维数组，数值列统一为 C 连续的 dtype 数组，
+    可直接交给向量化规则和融合扫描内核使用。
+    
+    dtype 默认 float64；大组合可选 float32，数值列内存与扫描带宽减半，
+    比例计算精度约 7 位有效数字，足以比较风控阈值，但恰好落在阈值上的
+    比例可能与 float64 结果不同。
+    """
+    symbols: np.ndarray
+    current: np.ndarray
+    avg: np.ndarray
+    prev_close: np.ndarray
+    position: np.ndarray
+    volume: Optional[np.ndarray] = None
+    avg_volume: Optional[np.ndarray] = None
+    volatility: Optional[np.ndarray] = None
+    dtype: Any = np.float64
+    
+    _NUMERIC_COLUMNS = ('current', 'avg', 'prev_close', 'position',
+                        'volume', 'avg_volume', 'volatility')
+    
+    def __post_init__(self):
+        self.dtype = np.dtype(self.dtype)
+        if self.dtype not in _PORTFOLIO_DTYPES:
+            raise ValueError(f"不支持的组合数据精度: {self.dtype}，应为 float64 或 float32")
+        
+        self.symbols = np.asarray(self.symbols, dtype=object)
+        n = len(self.symbols)
+        for name in self._NUMERIC_COLUMNS:
+            values = getattr(self, name)
+            if values is None:
+                continue
+            # 已是 C 连续且精度一致时不复制
+            values = np.ascontiguousarray(values, dtype=self.dtype)
+            if values.shape != (n,):
+                raise ValueError(f"组合数据列长度不一致: {name} {values.shape} != ({n},)")
+            setattr(self, name, values)
+    
+    def __len__(self) -> int:
+        return len(self.symbols)
+    
+    @property
+    def has_liquidity(self) -> bool:
+        """是否包含流动性检查所需的成交量数据"""
+        return self.volume is not None and self.avg_volume is not None
+    
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame, dtype: Any = np.float64) -> 'PortfolioArrays':
+        """
+        从持仓 DataFrame 构造
+        
+        Args:
+            df: 包含 symbol、current_price、avg_price、prev_close、position_size 列，
+                可选 volume、avg_volume、volatility 列
+            dtype: 数值列精度，float64 或 float32
+        """
+        def optional(column: str) -> Optional[np.ndarray]:
+            return df[column].to_numpy(dtype=dtype) if column in df.columns else None
+        
+        return cls(
+            symbols=df['symbol'].to_numpy(dtype=object),
+            current=df['current_price'].to_numpy(dtype=dtype),
+            avg=df['avg_price'].to_numpy(dtype=dtype),
+            prev_close=df['prev_close'].to_numpy(dtype=dtype),
+            position=df['position_size'].to_numpy(dtype=dtype),
+            volume=optional('volume'),
+            avg_volume=optional('avg_volume'),
+            volatility=optional('volatility'),
+            dtype=dtype
+        )
+
+
 class BaseRiskRule(ABC):
     """风控规则基类"""
     
@@ -88,6 +281,17 @@ class BaseRiskRule(ABC):
         self.risk_config = risk_config
         self.enabled = True
         self.last_check_time: Optional[datetime] = None
+        self._config_version = -1
+        self.refresh_config()
+    
+    def refresh_config(self):
+        """重新读取配置阈值，子类在此缓存热路径上使用的参数"""
+        self._config_version = self.risk_config.config_version
+    
+    def _sync_config(self):
+        """配置版本变化时刷新缓存的阈值"""
+        if self._config_version != self.risk_config.config_version:
+            self.refresh_config()
     
     @abstractmethod
     def check(self, **kwargs) -> RiskCheckResult:
@@ -112,11 +316,18 @@ class BaseRiskRule(ABC):
 class StopLossRule(BaseRiskRule):
     """止损规则"""
     
+    _MSG = "触发止损: 亏损{0:.2%} > 止损线{1:.2%}"
+    
     def __init__(self, risk_config: RiskConfig):
         super().__init__("止损规则", risk_config)
     
-    def check(self, symbol: str, current_price: float, avg_price: float, 
-              position_size: float, **kwargs) -> RiskCheckResult:
+    def refresh_config(self):
+        super().refresh_config()
+        self._threshold = self.risk_config.price_limits.stop_loss_ratio
+    
+    def check(self, symbol: str, current_price: float, avg_price: float,
+              position_size: float, now: Optional[datetime] = None,
+              **kwargs) -> RiskCheckResult:
         """
         检查止损规则
         
@@ -125,15 +336,21 @@ class StopLossRule(BaseRiskRule):
             current_price: 当前价格
             avg_price: 平均成本价
             position_size: 持仓数量
+            now: 检查时间，由管理器在一次检查周期内统一传入，默认取当前时间
         """
         result = RiskCheckResult(RiskCheckStatus.PASS)
         
         if not self.is_enabled() or position_size == 0:
             return result
         
+        if now is None:
+            now = datetime.now()
+        
+        self._sync_config()
+        
         # 计算亏损比例
         loss_ratio = (avg_price - current_price) / avg_price
-        stop_loss_threshold = self.risk_config.price_limits.stop_loss_ratio
+        stop_loss_threshold = self._threshold
         
         if loss_ratio > stop_loss_threshold:
             violation = RiskViolation(
@@ -143,11 +360,53 @@ class StopLossRule(BaseRiskRule):
                 current_value=loss_ratio,
                 limit_value=stop_loss_threshold,
                 risk_level=RiskLevel.HIGH,
-                message=f"触发止损: 亏损{loss_ratio:.2%} > 止损线{stop_loss_threshold:.2%}"
+                template=self._MSG,
+                args=(loss_ratio, stop_loss_threshold),
+                timestamp=now
             )
             result.add_violation(violation)
         
-        self.last_check_time = datetime.now()
+        self.last_check_time = now
+        return result
+    
+    def check_batch(self, portfolio: PortfolioArrays,
+                    now: Optional[datetime] = None) -> RiskCheckResult:
+        """
+        批量检查止损规则（一次向量运算覆盖整个组合）
+        
+        Args:
+            portfolio: 组合持仓列式数据
+            now: 本批违规记录的时间戳（默认取当前时间）
+        """
+        result = RiskCheckResult(RiskCheckStatus.PASS)
+        
+        if not self.is_enabled():
+            return result
+        
+        self._sync_config()
+        
+        symbols = portfolio.symbols
+        loss_ratio = (portfolio.avg - portfolio.current) / portfolio.avg
+        stop_loss_threshold = self._threshold
+        
+        mask = (portfolio.position != 0) & (loss_ratio > stop_loss_threshold)
+        if now is None:
+            now = datetime.now()
+        for i in np.flatnonzero(mask):
+            ratio = float(loss_ratio[i])
+            result.add_violation(RiskViolation(
+                rule_name=self.name,
+                violation_type=RiskEventType.STOP_LOSS,
+                symbol=symbols[i],
+                current_value=ratio,
+                limit_value=stop_loss_threshold,
+                risk_level=RiskLevel.HIGH,
+                template=self._MSG,
+                args=(ratio, stop_loss_threshold),
+                timestamp=now
+            ))
+        
+        self.last_check_time = now
         return result
 
 
@@ -157,8 +416,13 @@ class StopProfitRule(BaseRiskRule):
     def __init__(self, risk_config: RiskConfig):
         super().__init__("止盈规则", risk_config)
     
+    def refresh_config(self):
+        super().refresh_config()
+        self._threshold = self.risk_config.price_limits.stop_profit_ratio
+    
     def check(self, symbol: str, current_price: float, avg_price: float,
-              position_size: float, **kwargs) -> RiskCheckResult:
+              position_size: float, now: Optional[datetime] = None,
+              **kwargs) -> RiskCheckResult:
         """
         检查止盈规则
         
@@ -167,15 +431,21 @@ class StopProfitRule(BaseRiskRule):
             current_price: 当前价格
             avg_price: 平均成本价
             position_size: 持仓数量
+            now: 检查时间，由管理器在一次检查周期内统一传入，默认取当前时间
         """
         result = RiskCheckResult(RiskCheckStatus.PASS)
         
         if not self.is_enabled() or position_size == 0:
             return result
         
+        if now is None:
+            now = datetime.now()
+        
+        self._sync_config()
+        
         # 计算盈利比例
         profit_ratio = (current_price - avg_price) / avg_price
-        stop_profit_threshold = self.risk_config.price_limits.stop_profit_ratio
+        stop_profit_threshold = self._threshold
         
         if profit_ratio > stop_profit_threshold:
             # 止盈通常是建议性的，不强制阻止
@@ -183,41 +453,82 @@ class StopProfitRule(BaseRiskRule):
                 f"建议止盈: {symbol} 盈利{profit_ratio:.2%} > 止盈线{stop_profit_threshold:.2%}"
             )
         
-        self.last_check_time = datetime.now()
+        self.last_check_time = now
+        return result
+    
+    def check_batch(self, portfolio: PortfolioArrays,
+                    now: Optional[datetime] = None) -> RiskCheckResult:
+        """
+        批量检查止盈规则
+        
+        Args:
+            portfolio: 组合持仓列式数据
+            now: 本批违规记录的时间戳（默认取当前时间）
+        """
+        result = RiskCheckResult(RiskCheckStatus.PASS)
+        
+        if not self.is_enabled():
+            return result
+        
+        self._sync_config()
+        
+        symbols = portfolio.symbols
+        profit_ratio = (portfolio.current - portfolio.avg) / portfolio.avg
+        stop_profit_threshold = self._threshold
+        
+        mask = (portfolio.position != 0) & (profit_ratio > stop_profit_threshold)
+        if now is None:
+            now = datetime.now()
+        for i in np.flatnonzero(mask):
+            result.warnings.append(
+                f"建议止盈: {symbols[i]} 盈利{profit_ratio[i]:.2%} > 止盈线{stop_profit_threshold:.2%}"
+            )
+        
+        self.last_check_time = now
         return result
 
 
 class VolatilityRule(BaseRiskRule):
     """波动率风控规则"""
     
+    _MSG = "波动率过高: {0:.4f} > 阈值{1:.4f}"
+    # 风险分档：下标 = (波动率 > 阈值) + (波动率 > 2倍阈值)
+    _LEVELS = (RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH)
+    
     def __init__(self, risk_config: RiskConfig):
         super().__init__("波动率规则", risk_config)
     
-    def check(self, symbol: str, price_data: pd.Series, **kwargs) -> RiskCheckResult:
+    def refresh_config(self):
+        super().refresh_config()
+        self._threshold = self.risk_config.price_limits.volatility_threshold
+    
+    def check(self, symbol: str, price_data: Union[pd.Series, np.ndarray],
+              now: Optional[datetime] = None, **kwargs) -> RiskCheckResult:
         """
         检查波动率风控
         
         Args:
             symbol: 股票代码
-            price_data: 价格序列（最近N天的收盘价）
+            price_data: 价格序列（最近N天的收盘价），支持 pd.Series 或 np.ndarray
+            now: 检查时间，由管理器在一次检查周期内统一传入，默认取当前时间
         """
         result = RiskCheckResult(RiskCheckStatus.PASS)
         
         if not self.is_enabled() or len(price_data) < 2:
             return result
         
-        # 计算日收益率
-        returns = price_data.pct_change().dropna()
+        if now is None:
+            now = datetime.now()
         
-        if len(returns) == 0:
+        volatility = self._calculate_volatility(price_data)
+        if volatility is None:
             return result
         
-        # 计算波动率（标准差）
-        volatility = returns.std()
-        volatility_threshold = self.risk_config.price_limits.volatility_threshold
+        self._sync_config()
+        volatility_threshold = self._threshold
         
         if volatility > volatility_threshold:
-            risk_level = RiskLevel.HIGH if volatility > volatility_threshold * 2 else RiskLevel.MEDIUM
+            risk_level = self._LEVELS[1 + (volatility > volatility_threshold * 2)]
             
             violation = RiskViolation(
                 rule_name=self.name,
@@ -226,22 +537,49 @@ class VolatilityRule(BaseRiskRule):
                 current_value=volatility,
                 limit_value=volatility_threshold,
                 risk_level=risk_level,
-                message=f"波动率过高: {volatility:.4f} > 阈值{volatility_threshold:.4f}"
+                template=self._MSG,
+                args=(volatility, volatility_threshold),
+                timestamp=now
             )
             result.add_violation(violation)
         
-        self.last_check_time = datetime.now()
+        self.last_check_time = now
         return result
+    
+    @staticmethod
+    def _calculate_volatility(price_data: Union[pd.Series, np.ndarray]) -> Optional[float]:
+        """计算日收益率的标准差，无有效收益率时返回None"""
+        if _vol_welford is not None:
+            if isinstance(price_data, pd.Series):
+                prices = price_data.to_numpy(dtype=np.float64, copy=False)
+            else:
+                prices = np.asarray(price_data, dtype=np.float64)
+            
+            # 含缺失值、无穷值或非正价格时交由pandas处理（pct_change会前向填充）
+            if np.isfinite(prices).all() and (prices > 0).all():
+                return _vol_welford(prices)
+        
+        returns = pd.Series(price_data).pct_change().dropna()
+        if len(returns) == 0:
+            return None
+        return returns.std()
 
 
 class PriceLimitRule(BaseRiskRule):
     """涨跌停风控规则"""
     
+    _MSG_UP = "接近涨停: 涨幅{0:.2%}"
+    _MSG_DOWN = "接近跌停: 跌幅{0:.2%}"
+    
     def __init__(self, risk_config: RiskConfig):
         super().__init__("涨跌停规则", risk_config)
     
-    def check(self, symbol: str, current_price: float, prev_close: float, 
-              **kwargs) -> RiskCheckResult:
+    def refresh_config(self):
+        super().refresh_config()
+        self._buffer = self.risk_config.price_limits.price_limit_buffer
+    
+    def check(self, symbol: str, current_price: float, prev_close: float,
+              now: Optional[datetime] = None, **kwargs) -> RiskCheckResult:
         """
         检查涨跌停风控
         
@@ -249,15 +587,20 @@ class PriceLimitRule(BaseRiskRule):
             symbol: 股票代码
             current_price: 当前价格
             prev_close: 前收盘价
+            now: 检查时间，由管理器在一次检查周期内统一传入，默认取当前时间
         """
         result = RiskCheckResult(RiskCheckStatus.PASS)
         
         if not self.is_enabled():
             return result
         
+        if now is None:
+            now = datetime.now()
+        
         # 计算涨跌幅
+        self._sync_config()
         price_change_ratio = (current_price - prev_close) / prev_close
-        buffer = self.risk_config.price_limits.price_limit_buffer
+        buffer = self._buffer
         
         # 检查接近涨停（假设涨停为10%）
         if price_change_ratio > (0.10 - buffer):
@@ -268,7 +611,9 @@ class PriceLimitRule(BaseRiskRule):
                 current_value=price_change_ratio,
                 limit_value=0.10 - buffer,
                 risk_level=RiskLevel.MEDIUM,
-                message=f"接近涨停: 涨幅{price_change_ratio:.2%}"
+                template=self._MSG_UP,
+                args=(price_change_ratio,),
+                timestamp=now
             )
             result.add_violation(violation)
         
@@ -281,22 +626,84 @@ class PriceLimitRule(BaseRiskRule):
                 current_value=price_change_ratio,
                 limit_value=-(0.10 - buffer),
                 risk_level=RiskLevel.HIGH,
-                message=f"接近跌停: 跌幅{price_change_ratio:.2%}"
+                template=self._MSG_DOWN,
+                args=(price_change_ratio,),
+                timestamp=now
             )
             result.add_violation(violation)
         
-        self.last_check_time = datetime.now()
+        self.last_check_time = now
+        return result
+    
+    def check_batch(self, portfolio: PortfolioArrays,
+                    now: Optional[datetime] = None) -> RiskCheckResult:
+        """
+        批量检查涨跌停风控
+        
+        Args:
+            portfolio: 组合持仓列式数据
+            now: 本批违规记录的时间戳（默认取当前时间）
+        """
+        result = RiskCheckResult(RiskCheckStatus.PASS)
+        
+        if not self.is_enabled():
+            return result
+        
+        self._sync_config()
+        
+        symbols = portfolio.symbols
+        prev = portfolio.prev_close
+        change_ratio = (portfolio.current - prev) / prev
+        limit = 0.10 - self._buffer
+        
+        # 1: 接近涨停, -1: 接近跌停, 0: 正常
+        direction = np.where(change_ratio > limit, 1, np.where(change_ratio < -limit, -1, 0))
+        if now is None:
+            now = datetime.now()
+        for i in np.flatnonzero(direction):
+            ratio = float(change_ratio[i])
+            if direction[i] > 0:
+                violation = RiskViolation(
+                    rule_name=self.name,
+                    violation_type=RiskEventType.CUSTOM,
+                    symbol=symbols[i],
+                    current_value=ratio,
+                    limit_value=limit,
+                    risk_level=RiskLevel.MEDIUM,
+                    template=self._MSG_UP,
+                    args=(ratio,),
+                    timestamp=now
+                )
+            else:
+                violation = RiskViolation(
+                    rule_name=self.name,
+                    violation_type=RiskEventType.CUSTOM,
+                    symbol=symbols[i],
+                    current_value=ratio,
+                    limit_value=-limit,
+                    risk_level=RiskLevel.HIGH,
+                    template=self._MSG_DOWN,
+                    args=(ratio,),
+                    timestamp=now
+                )
+            result.add_violation(violation)
+        
+        self.last_check_time = now
         return result
 
 
 class LiquidityRule(BaseRiskRule):
     """流动性风控规则"""
     
+    _MSG_LOW_VOLUME = "成交量异常偏低: {0:.0f} < 平均值30%({1:.0f})"
+    _MSG_TRADE_SIZE = "交易量过大: {0:.0f} > 成交量20%({1:.0f})"
+    
     def __init__(self, risk_config: RiskConfig):
         super().__init__("流动性规则", risk_config)
     
-    def check(self, symbol: str, volume: float, avg_volume: float, 
-              trade_volume: float = 0, **kwargs) -> RiskCheckResult:
+    def check(self, symbol: str, volume: float, avg_volume: float,
+              trade_volume: float = 0, now: Optional[datetime] = None,
+              **kwargs) -> RiskCheckResult:
         """
         检查流动性风控
         
@@ -305,12 +712,16 @@ class LiquidityRule(BaseRiskRule):
             volume: 当前成交量
             avg_volume: 平均成交量
             trade_volume: 交易量
+            now: 检查时间，由管理器在一次检查周期内统一传入，默认取当前时间
         """
         result = RiskCheckResult(RiskCheckStatus.PASS)
         
         if not self.is_enabled():
             return result
         
+        if now is None:
+            now = datetime.now()
+        
         # 检查成交量异常（过低）
         if volume < avg_volume * 0.3:  # 成交量低于平均的30%
             violation = RiskViolation(
@@ -320,7 +731,9 @@ class LiquidityRule(BaseRiskRule):
                 current_value=volume,
                 limit_value=avg_volume * 0.3,
                 risk_level=RiskLevel.MEDIUM,
-                message=f"成交量异常偏低: {volume:.0f} < 平均值30%({avg_volume*0.3:.0f})"
+                template=self._MSG_LOW_VOLUME,
+                args=(volume, avg_volume * 0.3),
+                timestamp=now
             )
             result.add_violation(violation)
         
@@ -335,42 +748,114 @@ class LiquidityRule(BaseRiskRule):
                     current_value=trade_volume,
                     limit_value=volume * 0.2,
                     risk_level=RiskLevel.HIGH,
-                    message=f"交易量过大: {trade_volume:.0f} > 成交量20%({volume*0.2:.0f})"
+                    template=self._MSG_TRADE_SIZE,
+                    args=(trade_volume, volume * 0.2),
+                    timestamp=now
                 )
                 result.add_violation(violation)
         
-        self.last_check_time = datetime.now()
+        self.last_check_time = now
+        return result
+    
+    def check_batch(self, portfolio: PortfolioArrays,
+                    now: Optional[datetime] = None) -> RiskCheckResult:
+        """
+        批量检查成交量异常（组合数据不含交易量，只检查成交量偏低）
+        
+        Args:
+            portfolio: 组合持仓列式数据，需包含 volume、avg_volume
+            now: 本批违规记录的时间戳（默认取当前时间）
+        """
+        result = RiskCheckResult(RiskCheckStatus.PASS)
+        
+        if not self.is_enabled() or not portfolio.has_liquidity:
+            return result
+        
+        symbols = portfolio.symbols
+        volume = portfolio.volume
+        floor = portfolio.avg_volume * 0.3
+        
+        if now is None:
+            now = datetime.now()
+        for i in np.flatnonzero(volume < floor):
+            result.add_violation(RiskViolation(
+                rule_name=self.name,
+                violation_type=RiskEventType.LIQUIDITY_LIMIT,
+                symbol=symbols[i],
+                current_value=float(volume[i]),
+                limit_value=float(floor[i]),
+                risk_level=RiskLevel.MEDIUM,
+                template=self._MSG_LOW_VOLUME,
+                args=(volume[i], floor[i]),
+                timestamp=now
+            ))
+        
+        self.last_check_time = now
         return result
 
 
 class TradingTimeRule(BaseRiskRule):
     """交易时间风控规则"""
     
+    _MSG_OFF_HOURS = "非交易时间: {0} 不在 {1}-{2}"
+    _MSG_BLACKOUT = "禁止交易日期: {0:%Y-%m-%d}"
+    
     def __init__(self, risk_config: RiskConfig):
         super().__init__("交易时间规则", risk_config)
     
-    def check(self, current_time: Optional[datetime] = None, **kwargs) -> RiskCheckResult:
+    def refresh_config(self):
+        super().refresh_config()
+        time_limits = self.risk_config.time_limits
+        self._start_time = _parse_time(time_limits.trading_start_time)
+        self._end_time = _parse_time(time_limits.trading_end_time)
+        # 以"当日微秒数"整数比较，避免每次检查构造 time 对象
+        self._start_us = self._time_of_day_us(self._start_time)
+        self._end_us = self._time_of_day_us(self._end_time)
+        self._blackout_ords = self._parse_blackout_dates(tuple(time_limits.blackout_dates))
+    
+    @staticmethod
+    def _time_of_day_us(t) -> int:
+        """time/datetime 转换为当日微秒数"""
+        return ((t.hour * 60 + t.minute) * 60 + t.second) * 1_000_000 + t.microsecond
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _parse_blackout_dates(blackout_dates: Tuple[str, ...]) -> frozenset:
+        """禁止交易日期转换为日期序数集合（按日期元组缓存）"""
+        ordinals = set()
+        for date_str in blackout_dates:
+            try:
+                ordinals.add(datetime.strptime(date_str, "%Y-%m-%d").toordinal())
+            except (TypeError, ValueError):
+                logger.warning(f"忽略无效的禁止交易日期: {date_str}")
+        return frozenset(ordinals)
+    
+    def check(self, current_time: Optional[datetime] = None,
+              now: Optional[datetime] = None, **kwargs) -> RiskCheckResult:
         """
         检查交易时间风控
         
         Args:
             current_time: 当前时间，如果为None则使用系统时间
+            now: 检查时间，由管理器在一次检查周期内统一传入，默认取当前时间
         """
         result = RiskCheckResult(RiskCheckStatus.PASS)
         
         if not self.is_enabled():
             return result
         
+        if now is None:
+            now = datetime.now()
         if current_time is None:
-            current_time = datetime.now()
+            current_time = now
         
-        # 获取配置的交易时间
-        start_time = time.fromisoformat(self.risk_config.time_limits.trading_start_time)
-        end_time = time.fromisoformat(self.risk_config.time_limits.trading_end_time)
-        current_time_only = current_time.time()
+        self._sync_config()
         
         # 检查是否在交易时间内
-        if not (start_time <= current_time_only <= end_time):
+        if not (self._start_us <= self._time_of_day_us(current_time) <= self._end_us):
+            start_time = self._start_time
+            end_time = self._end_time
+            current_time_only = current_time.time()
             violation = RiskViolation(
                 rule_name=self.name,
                 violation_type=RiskEventType.TIME_LIMIT,
@@ -378,13 +863,14 @@ class TradingTimeRule(BaseRiskRule):
                 current_value=current_time_only.hour * 100 + current_time_only.minute,
                 limit_value=start_time.hour * 100 + start_time.minute,
                 risk_level=RiskLevel.HIGH,
-                message=f"非交易时间: {current_time_only} 不在 {start_time}-{end_time}"
+                template=self._MSG_OFF_HOURS,
+                args=(current_time_only, start_time, end_time),
+                timestamp=now
             )
             result.add_violation(violation)
         
         # 检查禁止交易日期
-        current_date_str = current_time.strftime("%Y-%m-%d")
-        if current_date_str in self.risk_config.time_limits.blackout_dates:
+        if current_time.toordinal() in self._blackout_ords:
             violation = RiskViolation(
                 rule_name=self.name,
                 violation_type=RiskEventType.TIME_LIMIT,
@@ -392,38 +878,55 @@ class TradingTimeRule(BaseRiskRule):
                 current_value=0,
                 limit_value=1,
                 risk_level=RiskLevel.HIGH,
-                message=f"禁止交易日期: {current_date_str}"
+                template=self._MSG_BLACKOUT,
+                args=(current_time,),
+                timestamp=now
             )
             result.add_violation(violation)
         
-        self.last_check_time = datetime.now()
+        self.last_check_time = now
         return result
 
 
 class DailyLossRule(BaseRiskRule):
     """单日亏损限制规则"""
     
+    _MSG = "超出单日最大亏损: {0:.2%} > {1:.2%}"
+    
     def __init__(self, risk_config: RiskConfig):
+        # 最近一次检查所在的交易日
+        self._cached_date: Optional[date] = None
         super().__init__("单日亏损规则", risk_config)
-        self._daily_pnl_cache: Dict[str, float] = {}  # 按日期缓存PnL
     
-    def check(self, total_pnl_today: float, initial_capital: float, 
-              **kwargs) -> RiskCheckResult:
+    def refresh_config(self):
+        super().refresh_config()
+        self._max_daily_loss = self.risk_config.price_limits.max_daily_loss_ratio
+    
+    def check(self, total_pnl_today: float, initial_capital: float,
+              now: Optional[datetime] = None, **kwargs) -> RiskCheckResult:
         """
         检查单日亏损限制
         
         Args:
             total_pnl_today: 今日总盈亏
             initial_capital: 初始资金
+            now: 检查时间，由管理器在一次检查周期内统一传入，默认取当前时间
         """
-        result = RiskCheckResult(RiskCheckStatus.PASS)
-        
         if not self.is_enabled():
-            return result
+            return RiskCheckResult(RiskCheckStatus.PASS)
+        
+        if now is None:
+            now = datetime.now()
+        
+        self._sync_config()
+        
+        self._cached_date = now.date()
+        
+        result = RiskCheckResult(RiskCheckStatus.PASS)
         
         # 计算今日亏损比例
         daily_loss_ratio = abs(min(0, total_pnl_today)) / initial_capital
-        max_daily_loss = self.risk_config.price_limits.max_daily_loss_ratio
+        max_daily_loss = self._max_daily_loss
         
         if daily_loss_ratio > max_daily_loss:
             violation = RiskViolation(
@@ -433,17 +936,22 @@ class DailyLossRule(BaseRiskRule):
                 current_value=daily_loss_ratio,
                 limit_value=max_daily_loss,
                 risk_level=RiskLevel.CRITICAL,
-                message=f"超出单日最大亏损: {daily_loss_ratio:.2%} > {max_daily_loss:.2%}"
+                template=self._MSG,
+                args=(daily_loss_ratio, max_daily_loss),
+                timestamp=now
             )
             result.add_violation(violation)
         
-        self.last_check_time = datetime.now()
+        self.last_check_time = now
         return result
 
 
 class BaseRiskManager:
     """基础风控管理器"""
     
+    # 由融合扫描统一处理的逐票规则（volatility 仅在组合数据提供波动率列时参与）
+    _FUSED_RULES = ('stop_loss', 'stop_profit', 'price_limit')
+    
     def __init__(self, risk_config: RiskConfig):
         """
         初始化风控管理器
@@ -453,6 +961,8 @@ class BaseRiskManager:
         """
         self.risk_config = risk_config
         self.rules: Dict[str, BaseRiskRule] = {}
+        # 最近一次通过管理器执行检查的时间
+        self._last_check_time: Optional[datetime] = None
         
         # 初始化所有风控规则
         self._initialize_rules()
@@ -473,53 +983,91 @@ class BaseRiskManager:
         
         logger.info(f"已初始化 {len(self.rules)} 个风控规则")
     
-    def check_all_rules(self, **kwargs) -> RiskCheckResult:
+    def check_all_rules(self, portfolio: Optional[Union[PortfolioArrays, pd.DataFrame]] = None,
+                        **kwargs) -> RiskCheckResult:
         """
         执行所有风控检查
         
+        规则按 risk_config.rule_execution.rule_priority 顺序执行；
+        启用 fast_fail 时，出现阻止级结果后不再执行剩余规则。
+        
         Args:
+            portfolio: 组合持仓数据（可选），PortfolioArrays 或可由
+                       PortfolioArrays.from_dataframe 转换的 DataFrame。提供时
+                       止损、止盈、涨跌停（及有数据时的波动率、流动性）规则
+                       直接在列数组上批量完成；缺少波动率、流动性列时跳过这两条规则
             **kwargs: 传递给各个规则的参数
             
         Returns:
             综合风控检查结果
         """
+        # 同一次检查产生的违规记录共用一个时间戳
+        now = datetime.now()
+        combined_result = self._run_rules(portfolio, now, kwargs)
+        self._record_events(combined_result)
+        self._last_check_time = now
+        return combined_result
+    
+    def _run_rules(self, portfolio: Optional[Union[PortfolioArrays, pd.DataFrame]],
+                   now: datetime, kwargs: Dict[str, Any]) -> RiskCheckResult:
+        """按优先级执行全部规则并合并结果（不记录风控事件）"""
         combined_result = RiskCheckResult(RiskCheckStatus.PASS)
         combined_result.risk_score = 0.0
         
-        for rule_name, rule in self.rules.items():
-            if rule.is_enabled():
+        fused_rules: Tuple[str, ...] = ()
+        skipped_rules: Tuple[str, ...] = ()
+        batch_liquidity = False
+        if portfolio is not None:
+            if isinstance(portfolio, pd.DataFrame):
+                portfolio = PortfolioArrays.from_dataframe(portfolio)
+            
+            fused_rules = self._FUSED_RULES
+            # 组合数据缺少对应列时跳过波动率、流动性规则，不退回缺参的逐票检查
+            if portfolio.volatility is not None:
+                fused_rules += ('volatility',)
+            else:
+                skipped_rules += ('volatility',)
+            batch_liquidity = portfolio.has_liquidity
+            if not batch_liquidity:
+                skipped_rules += ('liquidity',)
+        
+        fused_done = False
+        fast_fail = self.risk_config.rule_execution.fast_fail
+        for rule_name in self._ordered_rule_names():
+            rule = self.rules[rule_name]
+            if not rule.is_enabled() or rule_name in skipped_rules:
+                continue
+            
+            if rule_name in fused_rules:
+                # 融合扫描一次覆盖全部融合规则，在优先级最高的融合规则处执行
+                if fused_done:
+                    continue
+                fused_done = True
                 try:
-                    result = rule.check(**kwargs)
-                    
-                    # 合并结果
-                    combined_result.violations.extend(result.violations)
-                    combined_result.warnings.extend(result.warnings)
-                    combined_result.blocked_operations.extend(result.blocked_operations)
-                    
-                    # 更新状态（取最严重的状态）
-                    if result.status == RiskCheckStatus.BLOCKED:
-                        combined_result.status = RiskCheckStatus.BLOCKED
-                    elif (result.status == RiskCheckStatus.WARNING and 
-                          combined_result.status == RiskCheckStatus.PASS):
-                        combined_result.status = RiskCheckStatus.WARNING
-                    
-                    # 计算风险分数
-                    for violation in result.violations:
-                        if violation.risk_level == RiskLevel.CRITICAL:
-                            combined_result.risk_score += 10.0
-                        elif violation.risk_level == RiskLevel.HIGH:
-                            combined_result.risk_score += 5.0
-                        elif violation.risk_level == RiskLevel.MEDIUM:
-                            combined_result.risk_score += 2.0
-                        elif violation.risk_level == RiskLevel.LOW:
-                            combined_result.risk_score += 1.0
-                    
+                    self._merge_result(combined_result, self._check_portfolio_fused(portfolio, now))
+                except Exception as e:
+                    logger.error(f"组合融合风控检查失败, 错误: {str(e)}")
+                    combined_result.warnings.append("组合融合风控检查执行失败")
+            else:
+                try:
+                    if rule_name == 'liquidity' and batch_liquidity:
+                        result = rule.check_batch(portfolio, now)
+                    else:
+                        result = rule.check(now=now, **kwargs)
+                    self._merge_result(combined_result, result)
                 except Exception as e:
                     logger.error(f"风控规则执行失败: {rule_name}, 错误: {str(e)}")
                     combined_result.warnings.append(f"风控规则 {rule_name} 执行失败")
+            
+            if fast_fail and combined_result.status == RiskCheckStatus.BLOCKED:
+                logger.debug(f"风控检查快速失败: {rule_name} 触发阻止，跳过剩余规则")
+                break
         
-        # 记录风控事件
-        for violation in combined_result.violations:
+        return combined_result
+    
+    def _record_events(self, result: RiskCheckResult):
+        """将检查结果中的违规记录写入风控事件日志"""
+        for violation in result.violations:
             event = RiskEvent(
                 event_type=violation.violation_type,
                 symbol=violation.symbol,
@@ -533,7 +1081,258 @@ class BaseRiskManager:
                 }
             )
             self.risk_config.add_risk_event(event)
+    
+    def _ordered_rule_names(self) -> List[str]:
+        """按 RiskConfig.rule_execution.rule_priority 排列规则，未列出的规则按注册顺序排在最后"""
+        priority = self.risk_config.rule_execution.rule_priority
+        ordered = [name for name in priority if name in self.rules]
+        ordered.extend(name for name in self.rules if name not in ordered)
+        return ordered
+    
+    def _merge_result(self, combined_result: RiskCheckResult, result: RiskCheckResult):
+        """将单个检查结果合并到综合结果"""
+        combined_result.violations.extend(result.violations)
+        combined_result.warnings.extend(result.warnings)
+        combined_result.blocked_operations.extend(result.blocked_operations)
+        
+        # 更新状态（取最严重的状态）
+        if result.status == RiskCheckStatus.BLOCKED:
+            combined_result.status = RiskCheckStatus.BLOCKED
+        elif (result.status == RiskCheckStatus.WARNING and 
+              combined_result.status == RiskCheckStatus.PASS):
+            combined_result.status = RiskCheckStatus.WARNING
+        
+        # 计算风险分数：按等级查表后一次求和
+        violations = result.violations
+        if violations:
+            levels = np.fromiter((v.risk_level.severity for v in violations),
+                                 dtype=np.intp, count=len(violations))
+            combined_result.risk_score += float(_RISK_SCORES[levels].sum())
+    
+    def _check_portfolio_fused(self, portfolio: PortfolioArrays,
+                               now: Optional[datetime] = None) -> RiskCheckResult:
+        """
+        融合扫描整个组合，一次遍历完成止损、止盈、涨跌停、波动率检查
         
+        Args:
+            portfolio: 组合持仓列式数据
+            now: 违规记录时间戳（默认取当前时间）
+            
+        Returns:
+            融合规则的检查结果
+        """
+        result = RiskCheckResult(RiskCheckStatus.PASS)
+        
+        stop_loss = self.rules['stop_loss']
+        stop_profit = self.rules['stop_profit']
+        price_limit = self.rules['price_limit']
+        volatility = self.rules['volatility']
+        
+        # 仅保留已启用规则的触发位
+        enabled_mask = 0
+        if stop_loss.is_enabled():
+            enabled_mask |= _fused.FLAG_STOP_LOSS
+        if stop_profit.is_enabled():
+            enabled_mask |= _fused.FLAG_STOP_PROFIT
+        if price_limit.is_enabled():
+            enabled_mask |= _fused.FLAG_UP_LIMIT | _fused.FLAG_DOWN_LIMIT
+        has_volatility = portfolio.volatility is not None
+        if has_volatility and volatility.is_enabled():
+            enabled_mask |= _fused.FLAG_HIGH_VOL
+        
+        if enabled_mask == 0:
+            return result
+        
+        for rule in (stop_loss, stop_profit, price_limit, volatility):
+            rule._sync_config()
+        
+        symbols = portfolio.symbols
+        if has_volatility:
+            vol = portfolio.volatility
+        else:
+            vol = np.full(len(portfolio), np.nan, dtype=portfolio.dtype)
+        
+        limit = 0.10 - price_limit._buffer
+        thresholds = np.array([stop_loss._threshold, stop_profit._threshold,
+                               limit, volatility._threshold], dtype=np.float64)
+        
+        flags, loss_ratio, change_ratio = _fused.scan(
+            portfolio.current, portfolio.avg, portfolio.prev_close, portfolio.position, vol, thresholds
+        )
+        flags &= enabled_mask
+        
+        if has_volatility:
+            # 波动率分档整列计算，避免逐票分支
+            vol_threshold = volatility._threshold
+            vol_tier = (vol > vol_threshold).astype(np.int8) + (vol > vol_threshold * 2)
+        else:
+            vol_tier = np.zeros(len(portfolio), dtype=np.int8)
+        
+        # 由触发位预先算出三类结果的条数，按确切容量分配列表，避免逐条追加时扩容
+        hit_stop_loss = (flags & _fused.FLAG_STOP_LOSS) != 0
+        hit_stop_profit = (flags & _fused.FLAG_STOP_PROFIT) != 0
+        hit_up = (flags & _fused.FLAG_UP_LIMIT) != 0
+        hit_down = (flags & _fused.FLAG_DOWN_LIMIT) != 0
+        hit_vol = (flags & _fused.FLAG_HIGH_VOL) != 0
+        n_high = int(np.count_nonzero(hit_stop_loss) + np.count_nonzero(hit_down)
+                     + np.count_nonzero(hit_vol & (vol_tier == 2)))
+        n_medium = int(np.count_nonzero(hit_up) + np.count_nonzero(hit_vol & (vol_tier == 1)))
+        n_warnings = n_medium + int(np.count_nonzero(hit_stop_profit))
+        
+        violations: List[Optional[RiskViolation]] = [None] * (n_high + n_medium)
+        warnings: List[Optional[str]] = [None] * n_warnings
+        blocked: List[Optional[str]] = [None] * n_high
+        iv = iw = ib = 0
+        
+        if now is None:
+            now = datetime.now()
+        for i in np.flatnonzero(flags):
+            flag = flags[i]
+            symbol = symbols[i]
+            
+            if flag & _fused.FLAG_STOP_LOSS:
+                ratio = float(loss_ratio[i])
+                violation = RiskViolation(
+                    rule_name=stop_loss.name,
+                    violation_type=RiskEventType.STOP_LOSS,
+                    symbol=symbol,
+                    current_value=ratio,
+                    limit_value=stop_loss._threshold,
+                    risk_level=RiskLevel.HIGH,
+                    template=StopLossRule._MSG,
+                    args=(ratio, stop_loss._threshold),
+                    timestamp=now
+                )
+                violations[iv] = violation
+                iv += 1
+                blocked[ib] = violation.message
+                ib += 1
+            
+            if flag & _fused.FLAG_STOP_PROFIT:
+                warnings[iw] = (
+                    f"建议止盈: {symbol} 盈利{-loss_ratio[i]:.2%} > 止盈线{stop_profit._threshold:.2%}"
+                )
+                iw += 1
+            
+            if flag & _fused.FLAG_UP_LIMIT:
+                ratio = float(change_ratio[i])
+                violation = RiskViolation(
+                    rule_name=price_limit.name,
+                    violation_type=RiskEventType.CUSTOM,
+                    symbol=symbol,
+                    current_value=ratio,
+                    limit_value=limit,
+                    risk_level=RiskLevel.MEDIUM,
+                    template=PriceLimitRule._MSG_UP,
+                    args=(ratio,),
+                    timestamp=now
+                )
+                violations[iv] = violation
+                iv += 1
+                warnings[iw] = violation.message
+                iw += 1
+            elif flag & _fused.FLAG_DOWN_LIMIT:
+                ratio = float(change_ratio[i])
+                violation = RiskViolation(
+                    rule_name=price_limit.name,
+                    violation_type=RiskEventType.CUSTOM,
+                    symbol=symbol,
+                    current_value=ratio,
+                    limit_value=-limit,
+                    risk_level=RiskLevel.HIGH,
+                    template=PriceLimitRule._MSG_DOWN,
+                    args=(ratio,),
+                    timestamp=now
+                )
+                violations[iv] = violation
+                iv += 1
+                blocked[ib] = violation.message
+                ib += 1
+            
+            if flag & _fused.FLAG_HIGH_VOL:
+                value = float(vol[i])
+                threshold = volatility._threshold
+                tier = vol_tier[i]
+                violation = RiskViolation(
+                    rule_name=volatility.name,
+                    violation_type=RiskEventType.VOLATILITY_LIMIT,
+                    symbol=symbol,
+                    current_value=value,
+                    limit_value=threshold,
+                    risk_level=VolatilityRule._LEVELS[tier],
+                    template=VolatilityRule._MSG,
+                    args=(value, threshold),
+                    timestamp=now
+                )
+                violations[iv] = violation
+                iv += 1
+                if tier == 2:
+                    blocked[ib] = violation.message
+                    ib += 1
+                else:
+                    warnings[iw] = violation.message
+                    iw += 1
+        
+        # 与逐条 add_violation 的状态规则一致：有高风险即阻止，有中风险则警告
+        if n_high:
+            status = RiskCheckStatus.BLOCKED
+        elif n_medium:
+            status = RiskCheckStatus.WARNING
+        else:
+            status = RiskCheckStatus.PASS
+        result = RiskCheckResult(status, violations, warnings, blocked)
+        
+        for rule in (stop_loss, stop_profit, price_limit, volatility):
+            if rule.is_enabled() and (rule is not volatility or has_volatility):
+                rule.last_check_time = now
+        
+        return result
+    
+    def check_symbols(self, symbol_params: List[Dict[str, Any]],
+                      max_workers: Optional[int] = None) -> RiskCheckResult:
+        """
+        逐票执行 check_all_rules 并合并结果（无法整理为 PortfolioArrays 时使用）
+        
+        默认在调用线程上逐票串行执行：逐票规则是纯 Python 代码，不释放 GIL，
+        线程池只会增加调度开销。显式指定 max_workers 时在线程池中执行规则检查
+        （规则内含释放 GIL 的耗时调用时可能受益）；风控事件日志不是线程安全的，
+        违规事件始终由调用线程按输入顺序统一记录。
+        能提供列式数据时应优先使用 check_all_rules(portfolio)。
+        
+        Args:
+            symbol_params: 每只股票传给 check_all_rules 的参数字典
+            max_workers: 线程数，默认不使用线程池
+            
+        Returns:
+            合并后的风控检查结果
+        """
+        combined_result = RiskCheckResult(RiskCheckStatus.PASS)
+        if not symbol_params:
+            return combined_result
+        
+        now = datetime.now()
+        
+        def run(params: Dict[str, Any]) -> RiskCheckResult:
+            kwargs = dict(params)
+            portfolio = kwargs.pop('portfolio', None)
+            return self._run_rules(portfolio, now, kwargs)
+        
+        workers = min(max_workers or 1, len(symbol_params))
+        if workers <= 1:
+            results = [run(params) for params in symbol_params]
+        else:
+            # 提前在调用线程上同步配置，工作线程只读取阈值
+            for rule in self.rules.values():
+                rule._sync_config()
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="RiskCheck") as executor:
+                results = list(executor.map(run, symbol_params))
+        
+        # 按输入顺序合并并记录事件，结果与串行执行一致
+        for result in results:
+            self._record_events(result)
+            self._merge_result(combined_result, result)
+        
+        self._last_check_time = now
         return combined_result
     
     def check_single_rule(self, rule_name: str, **kwargs) -> Optional[RiskCheckResult]:
@@ -553,10 +1352,16 @@ class BaseRiskManager:
             return None
         
         try:
-            return rule.check(**kwargs)
+            result = rule.check(**kwargs)
         except Exception as e:
             logger.error(f"风控规则执行失败: {rule_name}, 错误: {str(e)}")
             return None
+        
+        last_check_time = rule.last_check_time
+        if last_check_time is not None and (
+                self._last_check_time is None or last_check_time > self._last_check_time):
+            self._last_check_time = last_check_time
+        return result
     
     def enable_rule(self, rule_name: str) -> bool:
         """启用风控规则"""
@@ -587,20 +1392,13 @@ class BaseRiskManager:
     
     def get_risk_summary(self) -> Dict[str, Any]:
         """获取风控摘要"""
-        recent_events = self.risk_config.get_recent_events(24)
-        
-        # 按风险等级统计事件
-        event_stats = {level.value: 0 for level in RiskLevel}
-        for event in recent_events:
-            event_stats[event.risk_level.value] += 1
+        # 按风险等级统计事件（使用按小时增量维护的计数，不扫描事件列表）
+        event_stats = self.risk_config.get_recent_event_counts(24)
         
         return {
             'total_rules': len(self.rules),
             'enabled_rules': len([r for r in self.rules.values() if r.is_enabled()]),
-            'recent_events_24h': len(recent_events),
+            'recent_events_24h': sum(event_stats.values()),
             'event_stats_24h': event_stats,
-            'last_check_time': max(
-                [r.last_check_time for r in self.rules.values() if r.last_check_time],
-                default=None
-            )
+            'last_check_time': self._last_check_time
         }
\ No newline at end of file
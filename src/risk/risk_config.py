@@ -12,21 +12,144 @@
 
 import logging
 import json
+import os
+import sys
+import functools
+import pickle
+from collections import namedtuple
 from enum import Enum
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, field, asdict
-from datetime import datetime, timedelta
-import pandas as pd
+from typing import Dict, Any, Optional, List, Union, Callable, Tuple, NamedTuple
+from dataclasses import dataclass, field
+from datetime import datetime, time, timedelta
+from time import monotonic
+import numpy as np
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+    zstandard = None
 
 logger = logging.getLogger(__name__)
 
 
+def _json_loads(data: bytes) -> Any:
+    """解析 JSON（优先使用 orjson）"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """序列化为缩进 2 空格的 UTF-8 JSON（优先使用 orjson）"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+@functools.lru_cache(maxsize=None)
+def _dataclass_fields(cls: type) -> frozenset:
+    """数据类的字段名集合（按类缓存），非数据类返回空集合"""
+    return frozenset(getattr(cls, '__dataclass_fields__', ()))
+
+
+def _config_asdict(instance: Any) -> Dict[str, Any]:
+    """
+    配置数据类转换为字典
+    
+    配置字段只有基本类型和字符串列表，按字段浅拷贝（列表复制一份），
+    代替 dataclasses.asdict 的递归深拷贝
+    """
+    result = {}
+    for name in instance.__dataclass_fields__:
+        value = getattr(instance, name)
+        result[name] = list(value) if isinstance(value, list) else value
+    return result
+
+
+@functools.lru_cache(maxsize=None)
+def _frozen_type(cls: type) -> type:
+    """配置数据类对应的只读 namedtuple 类型（按类缓存）"""
+    return namedtuple('Frozen' + cls.__name__, list(cls.__dataclass_fields__), module=__name__)
+
+
+def _freeze_dataclass(instance: Any) -> tuple:
+    """配置数据类转换为只读 namedtuple，列表字段转为元组"""
+    values = []
+    for name in instance.__dataclass_fields__:
+        value = getattr(instance, name)
+        values.append(tuple(value) if isinstance(value, list) else value)
+    return _frozen_type(type(instance))(*values)
+
+
+# 取值须在 0-1 之间的比例类参数
+_RATIO_PARAMS = frozenset({
+    'max_single_position_ratio', 'max_total_position_ratio',
+    'max_sector_concentration', 'stop_loss_ratio', 'stop_profit_ratio',
+    'max_daily_loss_ratio', 'max_drawdown_ratio', 'min_cash_ratio',
+    'risk_capital_ratio', 'emergency_cash_ratio'
+})
+
+# 取值须大于 0 的参数
+_POSITIVE_PARAMS = frozenset({
+    'max_individual_stocks', 'min_position_value', 'max_position_value',
+    'max_holding_days', 'cooling_period_hours', 'check_frequency_seconds',
+    'max_events_per_hour'
+})
+
+# "HH:MM" 格式的交易时间参数
+_TIME_PARAMS = frozenset({'trading_start_time', 'trading_end_time'})
+
+
+def _is_ratio(value: Any) -> bool:
+    return isinstance(value, (int, float)) and 0 <= value <= 1
+
+
+def _is_positive(value: Any) -> bool:
+    return isinstance(value, (int, float)) and value > 0
+
+
+def _is_time_of_day(value: Any) -> bool:
+    # 交易时间在更新时即校验格式，风控规则刷新配置时解析不会失败
+    try:
+        time.fromisoformat(value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+# 参数校验表 {参数名: (校验函数, 错误日志模板)}，未登记的参数不校验
+_VALIDATORS: Dict[str, Tuple[Callable[[Any], bool], str]] = {}
+_VALIDATORS.update(dict.fromkeys(_RATIO_PARAMS, (_is_ratio, "比例参数值无效: %s = %s, 应该在0-1之间")))
+_VALIDATORS.update(dict.fromkeys(_POSITIVE_PARAMS, (_is_positive, "正数参数值无效: %s = %s, 应该大于0")))
+_VALIDATORS.update(dict.fromkeys(_TIME_PARAMS, (_is_time_of_day, "交易时间格式无效: %s = %s, 应为HH:MM")))
+
+
 class RiskLevel(Enum):
-    """风险等级枚举"""
-    LOW = "low"           # 低风险
-    MEDIUM = "medium"     # 中风险  
-    HIGH = "high"         # 高风险
-    CRITICAL = "critical" # 极高风险
+    """
+    风险等级枚举
+    
+    value 保持字符串（序列化、接口输出使用），severity 为有序整数 1-4，
+    供评分查表和等级比较使用。
+    """
+    LOW = ("low", 1)            # 低风险
+    MEDIUM = ("medium", 2)      # 中风险
+    HIGH = ("high", 3)          # 高风险
+    CRITICAL = ("critical", 4)  # 极高风险
+    
+    def __new__(cls, value: str, severity: int):
+        obj = object.__new__(cls)
+        obj._value_ = value
+        obj.severity = severity
+        return obj
 
 
 class RiskEventType(Enum):
@@ -42,7 +165,11 @@ class RiskEventType(Enum):
     CUSTOM = "custom"                          # 自定义事件
 
 
-@dataclass
+# dataclass 的 slots 参数需要 Python 3.10+，低版本保持普通实例字典
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class RiskEvent:
     """风控事件数据结构"""
     event_type: RiskEventType
@@ -50,7 +177,7 @@ class RiskEvent:
     timestamp: datetime
     risk_level: RiskLevel
     message: str
-    details: Dict[str, Any] = field(default_factory=dict)
+    details: Optional[Dict[str, Any]] = None      # 无附加信息时为 None，避免为每个事件分配空字典
     handled: bool = False
     
     def to_dict(self) -> Dict[str, Any]:
@@ -61,11 +188,245 @@ class RiskEvent:
             'timestamp': self.timestamp.isoformat(),
             'risk_level': self.risk_level.value,
             'message': self.message,
-            'details': self.details,
+            'details': self.details if self.details is not None else {},
             'handled': self.handled
         }
 
 
+class RiskEventLog:
+    """
+    风控事件历史（列式存储）
+    
+    事件先进入待写入缓冲，每 FLUSH_SIZE 条批量转换为列：时间戳 datetime64[ns]，
+    事件类型、风险等级为 int8 编码，股票代码为字典编码的 int32，消息和详情保持对象列。
+    事件按时间顺序追加时时间戳列有序，时间窗口的起点用二分查找定位，
+    清理过期事件只需截掉列头；出现乱序时间戳时退化为向量化掩码。
+    按股票查询使用按需构建的股票 -> 行号索引，数据变化后失效重建。
+    设置 max_events 时为有界历史，超出容量后在写入列块时淘汰最早写入的事件。
+    查询返回按需构造的 RiskEvent 副本。
+    """
+    
+    FLUSH_SIZE = 256
+    
+    _EVENT_TYPES = tuple(RiskEventType)
+    _TYPE_CODES = {event_type: code for code, event_type in enumerate(_EVENT_TYPES)}
+    _LEVELS = tuple(RiskLevel)
+    _LEVEL_CODES = {level: code for code, level in enumerate(_LEVELS)}
+    
+    def __init__(self, max_events: Optional[int] = None):
+        self.max_events = max_events
+        self._pending: List[RiskEvent] = []
+        self._chunks: List[Dict[str, np.ndarray]] = []
+        self._symbols: List[str] = []
+        self._symbol_codes: Dict[str, int] = {}
+        self._size = 0
+        self._sorted = True       # 时间戳列是否按时间非递减
+        self._last_timestamp = None
+        self._symbol_index = None  # (按股票排序的行号, 各股票起始偏移)
+    
+    def __len__(self) -> int:
+        return self._size + len(self._pending)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # 序列化前写入缓冲并合并列块，快照只包含列数组
+        self._columns()
+        state = self.__dict__.copy()
+        state['_symbol_index'] = None
+        return state
+    
+    def __iter__(self):
+        return iter(self._select(None))
+    
+    def append(self, event: RiskEvent):
+        """追加事件"""
+        self._pending.append(event)
+        if len(self._pending) >= self.FLUSH_SIZE:
+            self._flush()
+    
+    def since(self, cutoff: datetime, symbol: Optional[str] = None) -> List[RiskEvent]:
+        """时间不早于 cutoff 的事件（可按股票过滤）"""
+        columns = self._columns()
+        if columns is None:
+            return []
+        code = None
+        if symbol is not None:
+            code = self._symbol_codes.get(symbol)
+            if code is None:
+                return []
+        
+        if self._sorted:
+            start = self._cutoff_index(columns, cutoff)
+            if code is None:
+                return self._select(slice(start, None))
+            rows = self._symbol_rows(columns, code)
+            return self._select(rows[np.searchsorted(rows, start):])
+        
+        mask = columns['timestamp'] >= np.datetime64(cutoff, 'ns')
+        if code is not None:
+            mask &= columns['symbol'] == code
+        return self._select(np.flatnonzero(mask))
+    
+    def count_since(self, cutoff: datetime) -> int:
+        """时间不早于 cutoff 的事件数量（不构造事件对象）"""
+        columns = self._columns()
+        if columns is None:
+            return 0
+        if self._sorted:
+            return self._size - self._cutoff_index(columns, cutoff)
+        return int(np.count_nonzero(columns['timestamp'] >= np.datetime64(cutoff, 'ns')))
+    
+    def value_counts(self, cutoff: datetime, column: str) -> Dict[Enum, int]:
+        """
+        按事件类型或风险等级统计 cutoff 之后的事件数（直接对编码列计数，不构造事件对象）
+        
+        Args:
+            cutoff: 起始时间
+            column: 'event_type' 或 'risk_level'
+        """
+        members = self._EVENT_TYPES if column == 'event_type' else self._LEVELS
+        columns = self._columns()
+        if columns is None:
+            return {member: 0 for member in members}
+        if self._sorted:
+            codes = columns[column][self._cutoff_index(columns, cutoff):]
+        else:
+            codes = columns[column][columns['timestamp'] >= np.datetime64(cutoff, 'ns')]
+        counts = np.bincount(codes, minlength=len(members))
+        return dict(zip(members, counts.tolist()))
+    
+    def prune(self, cutoff: datetime) -> int:
+        """删除早于 cutoff 的事件，返回删除数量"""
+        columns = self._columns()
+        if columns is None:
+            return 0
+        if self._sorted:
+            removed = self._cutoff_index(columns, cutoff)
+            if removed:
+                # 复制截断后的列，释放原数组
+                self._chunks = [{name: values[removed:].copy() for name, values in columns.items()}]
+                self._size -= removed
+                self._symbol_index = None
+            return removed
+        
+        keep = columns['timestamp'] >= np.datetime64(cutoff, 'ns')
+        removed = int(keep.size - np.count_nonzero(keep))
+        if removed:
+            self._chunks = [{name: values[keep] for name, values in columns.items()}]
+            self._size -= removed
+            self._symbol_index = None
+        return removed
+    
+    @staticmethod
+    def _cutoff_index(columns: Dict[str, np.ndarray], cutoff: datetime) -> int:
+        """有序时间戳列中第一个不早于 cutoff 的下标"""
+        return int(np.searchsorted(columns['timestamp'], np.datetime64(cutoff, 'ns'), side='left'))
+    
+    def _symbol_rows(self, columns: Dict[str, np.ndarray], code: int) -> np.ndarray:
+        """某股票的全部行号（升序，即时间顺序）"""
+        if self._symbol_index is None:
+            codes = columns['symbol']
+            # 稳定排序保证同一股票内行号升序
+            order = np.argsort(codes, kind='stable')
+            offsets = np.zeros(len(self._symbols) + 1, dtype=np.int64)
+            np.cumsum(np.bincount(codes, minlength=len(self._symbols)), out=offsets[1:])
+            self._symbol_index = (order, offsets)
+        order, offsets = self._symbol_index
+        return order[offsets[code]:offsets[code + 1]]
+    
+    def _symbol_code(self, symbol: str) -> int:
+        """股票代码的字典编码；每个代码只保存一份（驻留）字符串，查询结果中的事件共享该对象"""
+        code = self._symbol_codes.get(symbol)
+        if code is None:
+            if type(symbol) is str:
+                symbol = sys.intern(symbol)
+            code = len(self._symbols)
+            self._symbols.append(symbol)
+            self._symbol_codes[symbol] = code
+        return code
+    
+    def _flush(self):
+        """将缓冲中的事件转换为一个列块"""
+        pending = self._pending
+        if not pending:
+            return
+        n = len(pending)
+        timestamps = np.array([e.timestamp for e in pending], dtype='datetime64[ns]')
+        if self._sorted:
+            self._sorted = bool(
+                (self._last_timestamp is None or timestamps[0] >= self._last_timestamp)
+                and np.all(timestamps[1:] >= timestamps[:-1])
+            )
+            self._last_timestamp = timestamps[-1]
+        self._chunks.append({
+            'timestamp': timestamps,
+            'event_type': np.fromiter((self._TYPE_CODES[e.event_type] for e in pending),
+                                      dtype=np.int8, count=n),
+            'risk_level': np.fromiter((self._LEVEL_CODES[e.risk_level] for e in pending),
+                                      dtype=np.int8, count=n),
+            'symbol': np.fromiter((self._symbol_code(e.symbol) for e in pending),
+                                  dtype=np.int32, count=n),
+            'message': np.array([e.message for e in pending], dtype=object),
+            'details': np.array([e.details for e in pending], dtype=object),
+            'handled': np.fromiter((e.handled for e in pending), dtype=bool, count=n),
+        })
+        self._size += n
+        self._pending = []
+        self._symbol_index = None
+        self._evict()
+    
+    def _evict(self):
+        """超出容量时淘汰最早写入的事件：先整块丢弃，余下部分截掉首块头部"""
+        excess = self._size - self.max_events if self.max_events else 0
+        if excess <= 0:
+            return
+        chunks = self._chunks
+        while excess >= len(chunks[0]['timestamp']):
+            n = len(chunks.pop(0)['timestamp'])
+            self._size -= n
+            excess -= n
+        if excess:
+            chunks[0] = {name: values[excess:].copy() for name, values in chunks[0].items()}
+            self._size -= excess
+    
+    def _columns(self) -> Optional[Dict[str, np.ndarray]]:
+        """写入缓冲并合并列块，无事件时返回 None"""
+        self._flush()
+        if not self._chunks:
+            return None
+        if len(self._chunks) > 1:
+            self._chunks = [{name: np.concatenate([chunk[name] for chunk in self._chunks])
+                             for name in self._chunks[0]}]
+        return self._chunks[0]
+    
+    def _select(self, indices: Optional[Union[np.ndarray, slice]]) -> List[RiskEvent]:
+        """按下标（数组或切片）构造 RiskEvent 列表，indices 为 None 时返回全部"""
+        columns = self._columns()
+        if columns is None:
+            return []
+        if indices is not None:
+            columns = {name: values[indices] for name, values in columns.items()}
+        
+        timestamps = columns['timestamp'].astype('datetime64[us]').tolist()
+        event_types = self._EVENT_TYPES
+        levels = self._LEVELS
+        symbols = self._symbols
+        return [
+            RiskEvent(
+                event_type=event_types[type_code],
+                symbol=symbols[symbol_code],
+                timestamp=timestamp,
+                risk_level=levels[level_code],
+                message=message,
+                details=details,
+                handled=bool(handled)
+            )
+            for timestamp, type_code, level_code, symbol_code, message, details, handled in zip(
+                timestamps, columns['event_type'].tolist(), columns['risk_level'].tolist(),
+                columns['symbol'].tolist(), columns['message'], columns['details'], columns['handled']
+            )
+        ]
+
+
 @dataclass
 class PositionLimits:
     """仓位限制配置"""
@@ -119,9 +480,52 @@ class MonitoringConfig:
     max_events_per_hour: int = 100             # 每小时最大事件数
 
 
+@dataclass
+class RuleExecutionConfig:
+    """风控规则执行配置"""
+    fast_fail: bool = False                     # 出现阻止级结果后跳过剩余规则
+    # 规则执行顺序：开销小且最可能直接阻止交易的规则在前
+    rule_priority: List[str] = field(default_factory=lambda: [
+        'daily_loss', 'trading_time', 'stop_loss', 'price_limit',
+        'volatility', 'liquidity', 'stop_profit'
+    ])
+
+
+# 各配置分组的只读类型，定义为模块属性以便快照可被 pickle（spawn 方式启动的工作进程）
+FrozenPositionLimits = _frozen_type(PositionLimits)
+FrozenPriceLimits = _frozen_type(PriceLimits)
+FrozenCapitalLimits = _frozen_type(CapitalLimits)
+FrozenTimeLimits = _frozen_type(TimeLimits)
+FrozenMonitoringConfig = _frozen_type(MonitoringConfig)
+FrozenRuleExecutionConfig = _frozen_type(RuleExecutionConfig)
+
+
+class RiskConfigSnapshot(NamedTuple):
+    """
+    风控参数只读快照
+    
+    各分组为对应配置数据类的 namedtuple，字段名相同，可按 snapshot.price_limits.stop_loss_ratio
+    方式读取。在父进程中生成后 fork 出的工作进程共享同一份只读数据，无需各自加载配置文件。
+    """
+    position_limits: Any
+    price_limits: Any
+    capital_limits: Any
+    time_limits: Any
+    monitoring_config: Any
+    rule_execution: Any
+    config_version: int
+
+
 class RiskConfig:
     """风控配置管理器"""
     
+    # 事件计数保留的小时数
+    EVENT_COUNT_HOURS = 24
+    # 事件历史保留天数，与 max_events_per_hour 共同决定历史容量
+    EVENT_RETENTION_DAYS = 7
+    # 同类型、同股票事件的日志最小间隔（秒），间隔内的重复事件只记录不打日志
+    EVENT_LOG_INTERVAL = 1.0
+    
     def __init__(self, config_file: Optional[str] = None):
         """
         初始化风控配置
@@ -135,14 +539,23 @@ class RiskConfig:
         self.capital_limits = CapitalLimits()
         self.time_limits = TimeLimits()
         self.monitoring_config = MonitoringConfig()
+        self.rule_execution = RuleExecutionConfig()
         
-        # 风控事件历史
-        self.risk_events: List[RiskEvent] = []
+        # 风控事件历史（容量 = 每小时最大事件数 × 24 × 保留天数）
+        self.risk_events = RiskEventLog(max_events=self._event_capacity())
+        # 按小时分桶的事件计数 {小时序号: {风险等级: 数量}}，仅保留最近 EVENT_COUNT_HOURS 小时
+        self._hourly_event_counts: Dict[int, Dict[str, int]] = {}
+        # 事件日志限流 {(事件类型, 股票代码): 上次输出日志的单调时钟时间}
+        self._last_event_log: Dict[tuple, float] = {}
         
         # 动态配置缓存
         self._config_cache: Dict[str, Any] = {}
+        self._frozen: Optional[RiskConfigSnapshot] = None
         self._last_update: Optional[datetime] = None
         
+        # 配置版本号，每次参数变更递增，供风控规则判断缓存阈值是否过期
+        self.config_version = 0
+        
         # 如果指定了配置文件，加载配置
         if config_file:
             self.load_config(config_file)
@@ -159,9 +572,13 @@ class RiskConfig:
         Returns:
             加载是否成功
         """
+        if not os.path.isfile(config_file):
+            logger.error("风控配置文件不存在: %s", config_file)
+            return False
+        
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+            with open(config_file, 'rb') as f:
+                config_data = _json_loads(f.read())
             
             # 更新各个配置组件
             if 'position_limits' in config_data:
@@ -179,12 +596,18 @@ class RiskConfig:
             if 'monitoring_config' in config_data:
                 self._update_dataclass(self.monitoring_config, config_data['monitoring_config'])
             
+            if 'rule_execution' in config_data:
+                self._update_dataclass(self.rule_execution, config_data['rule_execution'])
+            
+            self.risk_events.max_events = self._event_capacity()
+            self.config_version += 1
             self._last_update = datetime.now()
-            logger.info(f"风控配置加载成功: {config_file}")
+            logger.info("风控配置加载成功: %s", config_file)
             return True
             
-        except Exception as e:
-            logger.error(f"加载风控配置失败: {config_file}, 错误: {str(e)}")
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            # ValueError 包括 json/orjson 的 JSONDecodeError，TypeError/AttributeError 为配置结构不符
+            logger.error("加载风控配置失败: %s, 错误: %s", config_file, e)
             return False
     
     def save_config(self, config_file: Optional[str] = None) -> bool:
@@ -203,29 +626,26 @@ class RiskConfig:
             return False
         
         try:
-            config_data = {
-                'position_limits': asdict(self.position_limits),
-                'price_limits': asdict(self.price_limits),
-                'capital_limits': asdict(self.capital_limits),
-                'time_limits': asdict(self.time_limits),
-                'monitoring_config': asdict(self.monitoring_config),
-                'last_update': datetime.now().isoformat()
-            }
+            # 强制按当前配置对象重新序列化，保证写入文件的内容最新；结果同时供配置摘要复用
+            config_data = dict(self._config_sections(refresh=True))
+            config_data['last_update'] = datetime.now().isoformat()
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, indent=2, ensure_ascii=False)
+            with open(file_path, 'wb') as f:
+                f.write(_json_dumps(config_data))
             
-            logger.info(f"风控配置保存成功: {file_path}")
+            logger.info("风控配置保存成功: %s", file_path)
             return True
             
-        except Exception as e:
-            logger.error(f"保存风控配置失败: {file_path}, 错误: {str(e)}")
+        except (OSError, TypeError) as e:
+            # TypeError 包括 orjson 的 JSONEncodeError
+            logger.error("保存风控配置失败: %s, 错误: %s", file_path, e)
             return False
     
     def _update_dataclass(self, instance: Any, data: Dict[str, Any]):
-        """更新数据类实例"""
+        """更新数据类实例（只更新已定义的字段）"""
+        fields = _dataclass_fields(type(instance))
         for key, value in data.items():
-            if hasattr(instance, key):
+            if key in fields:
                 setattr(instance, key, value)
     
     def update_parameter(self, category: str, parameter: str, value: Any) -> bool:
@@ -243,11 +663,11 @@ class RiskConfig:
         try:
             config_obj = getattr(self, category, None)
             if config_obj is None:
-                logger.error(f"未知的配置类别: {category}")
+                logger.error("未知的配置类别: %s", category)
                 return False
             
-            if not hasattr(config_obj, parameter):
-                logger.error(f"参数不存在: {category}.{parameter}")
+            if parameter not in _dataclass_fields(type(config_obj)):
+                logger.error("参数不存在: %s.%s", category, parameter)
                 return False
             
             # 验证参数值
@@ -255,40 +675,25 @@ class RiskConfig:
                 return False
             
             setattr(config_obj, parameter, value)
+            if parameter == 'max_events_per_hour':
+                self.risk_events.max_events = self._event_capacity()
+            self.config_version += 1
             self._last_update = datetime.now()
             
-            logger.info(f"配置参数已更新: {category}.{parameter} = {value}")
+            logger.info("配置参数已更新: %s.%s = %s", category, parameter, value)
             return True
             
         except Exception as e:
-            logger.error(f"更新配置参数失败: {category}.{parameter}, 错误: {str(e)}")
+            logger.error("更新配置参数失败: %s.%s, 错误: %s", category, parameter, e)
             return False
     
     def _validate_parameter(self, category: str, parameter: str, value: Any) -> bool:
         """验证参数值的有效性"""
-        # 比例类参数验证
-        ratio_params = [
-            'max_single_position_ratio', 'max_total_position_ratio', 
-            'max_sector_concentration', 'stop_loss_ratio', 'stop_profit_ratio',
-            'max_daily_loss_ratio', 'max_drawdown_ratio', 'min_cash_ratio',
-            'risk_capital_ratio', 'emergency_cash_ratio'
-        ]
-        
-        if parameter in ratio_params:
-            if not isinstance(value, (int, float)) or value < 0 or value > 1:
-                logger.error(f"比例参数值无效: {parameter} = {value}, 应该在0-1之间")
-                return False
-        
-        # 正数参数验证
-        positive_params = [
-            'max_individual_stocks', 'min_position_value', 'max_position_value',
-            'max_holding_days', 'cooling_period_hours', 'check_frequency_seconds',
-            'max_events_per_hour'
-        ]
-        
-        if parameter in positive_params:
-            if not isinstance(value, (int, float)) or value <= 0:
-                logger.error(f"正数参数值无效: {parameter} = {value}, 应该大于0")
+        validator = _VALIDATORS.get(parameter)
+        if validator is not None:
+            is_valid, error_message = validator
+            if not is_valid(value):
+                logger.error(error_message, parameter, value)
                 return False
         
         return True
@@ -303,46 +708,185 @@ class RiskConfig:
             return getattr(config_obj, parameter, None)
             
         except Exception as e:
-            logger.error(f"获取配置参数失败: {category}.{parameter}, 错误: {str(e)}")
+            logger.error("获取配置参数失败: %s.%s, 错误: %s", category, parameter, e)
             return None
     
+    def _event_capacity(self) -> int:
+        """事件历史容量"""
+        return self.monitoring_config.max_events_per_hour * 24 * self.EVENT_RETENTION_DAYS
+    
     def add_risk_event(self, event: RiskEvent):
         """添加风控事件"""
         self.risk_events.append(event)
-        logger.warning(f"风控事件: {event.event_type.value} - {event.symbol} - {event.message}")
+        self._count_event(event)
+        
+        key = (event.event_type, event.symbol)
+        now = monotonic()
+        if now - self._last_event_log.get(key, float('-inf')) >= self.EVENT_LOG_INTERVAL:
+            self._last_event_log[key] = now
+            logger.warning("风控事件: %s - %s - %s", event.event_type.value, event.symbol, event.message)
+    
+    @staticmethod
+    def _hour_index(timestamp: datetime) -> int:
+        """时间所在的小时序号"""
+        return timestamp.toordinal() * 24 + timestamp.hour
+    
+    def _count_event(self, event: RiskEvent):
+        """将事件计入所在小时的计数桶"""
+        hour = self._hour_index(event.timestamp)
+        counts = self._hourly_event_counts.get(hour)
+        if counts is None:
+            counts = {level.value: 0 for level in RiskLevel}
+            self._hourly_event_counts[hour] = counts
+            # 新建桶时淘汰过期的桶，桶数保持在 EVENT_COUNT_HOURS 左右
+            oldest = hour - self.EVENT_COUNT_HOURS
+            for expired in [h for h in self._hourly_event_counts if h <= oldest]:
+                del self._hourly_event_counts[expired]
+        counts[event.risk_level.value] += 1
+    
+    def get_recent_event_counts(self, hours: int = 24) -> Dict[str, int]:
+        """
+        按风险等级统计最近若干小时的事件数（按整点小时分桶，最多 EVENT_COUNT_HOURS 小时）
+        
+        与 get_recent_events 不同，不扫描事件列表，耗时与小时数成正比。
+        """
+        hours = min(hours, self.EVENT_COUNT_HOURS)
+        first_hour = self._hour_index(datetime.now()) - hours + 1
+        totals = {level.value: 0 for level in RiskLevel}
+        for hour, counts in self._hourly_event_counts.items():
+            if hour >= first_hour:
+                for level, count in counts.items():
+                    totals[level] += count
+        return totals
+    
+    def get_recent_event_stats(self, hours: int = 24) -> Dict[str, Dict[str, int]]:
+        """按风险等级和事件类型统计最近若干小时的事件数（滑动时间窗口）"""
+        cutoff_time = datetime.now() - timedelta(hours=hours)
+        return {
+            'by_level': {level.value: count for level, count in
+                         self.risk_events.value_counts(cutoff_time, 'risk_level').items()},
+            'by_type': {event_type.value: count for event_type, count in
+                        self.risk_events.value_counts(cutoff_time, 'event_type').items()}
+        }
     
     def get_recent_events(self, hours: int = 24) -> List[RiskEvent]:
         """获取最近的风控事件"""
         cutoff_time = datetime.now() - timedelta(hours=hours)
-        return [event for event in self.risk_events if event.timestamp >= cutoff_time]
+        return self.risk_events.since(cutoff_time)
     
     def get_events_by_symbol(self, symbol: str, hours: int = 24) -> List[RiskEvent]:
         """获取特定股票的风控事件"""
-        recent_events = self.get_recent_events(hours)
-        return [event for event in recent_events if event.symbol == symbol]
+        cutoff_time = datetime.now() - timedelta(hours=hours)
+        return self.risk_events.since(cutoff_time, symbol=symbol)
     
     def clear_old_events(self, days: int = 7):
         """清理旧的风控事件"""
         cutoff_time = datetime.now() - timedelta(days=days)
-        initial_count = len(self.risk_events)
-        self.risk_events = [event for event in self.risk_events if event.timestamp >= cutoff_time]
-        cleared_count = initial_count - len(self.risk_events)
+        cleared_count = self.risk_events.prune(cutoff_time)
         
         if cleared_count > 0:
-            logger.info(f"已清理 {cleared_count} 个过期风控事件")
+            logger.info("已清理 %s 个过期风控事件", cleared_count)
+    
+    # zstd 帧头，用于区分压缩快照和未压缩的 pickle 快照
+    _ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+    
+    def save_snapshot(self, snapshot_file: str) -> bool:
+        """
+        保存风控事件历史快照（pickle 协议 5，安装 zstandard 时压缩）
+        
+        事件历史体积大且为列式数组，不写入 JSON 配置文件；配置参数仍由 save_config 保存。
+        """
+        try:
+            data = pickle.dumps(
+                (self.risk_events, self._hourly_event_counts, self._last_update), protocol=5
+            )
+            if HAS_ZSTD:
+                data = zstandard.ZstdCompressor(level=3).compress(data)
+            with open(snapshot_file, 'wb') as f:
+                f.write(data)
+            logger.info("风控事件快照保存成功: %s (%s 个事件)", snapshot_file, len(self.risk_events))
+            return True
+        except (OSError, pickle.PicklingError) as e:
+            logger.error("保存风控事件快照失败: %s, 错误: %s", snapshot_file, e)
+            return False
+    
+    def load_snapshot(self, snapshot_file: str) -> bool:
+        """从快照恢复风控事件历史（仅加载可信来源的快照文件）"""
+        if not os.path.isfile(snapshot_file):
+            logger.error("风控事件快照不存在: %s", snapshot_file)
+            return False
+        
+        try:
+            with open(snapshot_file, 'rb') as f:
+                data = f.read()
+            if data[:4] == self._ZSTD_MAGIC:
+                if not HAS_ZSTD:
+                    logger.error("风控事件快照为 zstd 压缩格式，需要安装 zstandard: %s", snapshot_file)
+                    return False
+                data = zstandard.ZstdDecompressor().decompress(data)
+            risk_events, hourly_event_counts, last_update = pickle.loads(data)
+        except (OSError, pickle.UnpicklingError, ValueError, TypeError, EOFError) as e:
+            logger.error("加载风控事件快照失败: %s, 错误: %s", snapshot_file, e)
+            return False
+        
+        risk_events.max_events = self._event_capacity()
+        risk_events._evict()
+        self.risk_events = risk_events
+        self._hourly_event_counts = hourly_event_counts
+        if last_update is not None:
+            self._last_update = last_update
+        logger.info("风控事件快照加载成功: %s (%s 个事件)", snapshot_file, len(risk_events))
+        return True
     
     def get_config_summary(self) -> Dict[str, Any]:
         """获取配置摘要"""
-        return {
-            'position_limits': asdict(self.position_limits),
-            'price_limits': asdict(self.price_limits),
-            'capital_limits': asdict(self.capital_limits),
-            'time_limits': asdict(self.time_limits),
-            'monitoring_config': asdict(self.monitoring_config),
+        summary = {name: dict(values) for name, values in self._config_sections().items()}
+        summary.update({
             'last_update': self._last_update.isoformat() if self._last_update else None,
             'total_events': len(self.risk_events),
-            'recent_events': len(self.get_recent_events())
-        }
+            'recent_events': self.risk_events.count_since(datetime.now() - timedelta(hours=24))
+        })
+        return summary
+    
+    def _config_sections(self, refresh: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        各配置分组的字典形式（save_config 与 get_config_summary 共用）
+        
+        按 config_version 缓存，参数变更、重新加载或 refresh=True 时重建
+        """
+        if refresh or self._config_cache.get('version') != self.config_version:
+            self._config_cache = {
+                'version': self.config_version,
+                'sections': {
+                    'position_limits': _config_asdict(self.position_limits),
+                    'price_limits': _config_asdict(self.price_limits),
+                    'capital_limits': _config_asdict(self.capital_limits),
+                    'time_limits': _config_asdict(self.time_limits),
+                    'monitoring_config': _config_asdict(self.monitoring_config),
+                    'rule_execution': _config_asdict(self.rule_execution),
+                }
+            }
+        return self._config_cache['sections']
+    
+    def freeze(self) -> RiskConfigSnapshot:
+        """生成当前参数的只读快照"""
+        return RiskConfigSnapshot(
+            position_limits=_freeze_dataclass(self.position_limits),
+            price_limits=_freeze_dataclass(self.price_limits),
+            capital_limits=_freeze_dataclass(self.capital_limits),
+            time_limits=_freeze_dataclass(self.time_limits),
+            monitoring_config=_freeze_dataclass(self.monitoring_config),
+            rule_execution=_freeze_dataclass(self.rule_execution),
+            config_version=self.config_version
+        )
+    
+    @property
+    def frozen(self) -> RiskConfigSnapshot:
+        """当前参数的只读快照（按 config_version 缓存，参数变更后重建）"""
+        snapshot = self._frozen
+        if snapshot is None or snapshot.config_version != self.config_version:
+            snapshot = self._frozen = self.freeze()
+        return snapshot
     
     def validate_all_config(self) -> Dict[str, List[str]]:
         """验证所有配置的有效性"""
@@ -368,6 +912,14 @@ class RiskConfig:
         if total_reserved_ratio > 0.5:
             validation_results['warnings'].append("现金储备比例过高，可能影响收益")
         
+        # 验证交易时间
+        try:
+            if (time.fromisoformat(self.time_limits.trading_start_time) >=
+                    time.fromisoformat(self.time_limits.trading_end_time)):
+                validation_results['errors'].append("交易开始时间必须早于结束时间")
+        except (TypeError, ValueError):
+            validation_results['errors'].append("交易时间格式无效，应为HH:MM")
+        
         return validation_results
 
 
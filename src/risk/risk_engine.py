@@ -413,6 +413,9 @@ class RiskEngine:
                     # 这里可以添加执行相关的风控参数更新
                     pass
             
+            # 直接修改了配置对象，递增版本号使配置摘要等缓存失效
+            self.risk_config.config_version += 1
+            
             # 重新初始化风控规则（使新参数生效）
             self.base_risk_manager._initialize_rules()
             
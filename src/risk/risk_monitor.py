@@ -113,6 +113,9 @@ class MonitoringSummary:
 class RiskMonitor:
     """风控监控器"""
     
+    # 综合评分中各事件的分值，按 RiskLevel.severity 索引（LOW=1 .. CRITICAL=4）
+    _EVENT_SCORES = (0, 1, 5, 10, 20)
+    
     def __init__(self, risk_config: RiskConfig, base_risk_manager: BaseRiskManager,
                  position_manager: Optional[PositionManager] = None,
                  money_manager: Optional[MoneyManager] = None):
@@ -371,18 +374,11 @@ class RiskMonitor:
         """计算综合风险评分"""
         score = 0.0
         
-        # 基于违规数量和严重程度计算
-        recent_events = self.risk_config.get_recent_events(1)  # 最近1小时
+        # 基于违规数量和严重程度计算（最近1小时）
+        level_counts = self.risk_config.get_recent_event_stats(1)['by_level']
         
-        for event in recent_events:
-            if event.risk_level == RiskLevel.CRITICAL:
-                score += 20
-            elif event.risk_level == RiskLevel.HIGH:
-                score += 10
-            elif event.risk_level == RiskLevel.MEDIUM:
-                score += 5
-            elif event.risk_level == RiskLevel.LOW:
-                score += 1
+        for level, count in level_counts.items():
+            score += self._EVENT_SCORES[RiskLevel(level).severity] * count
         
         return min(score, 100.0)  # 最大100分
     
@@ -455,15 +451,12 @@ class RiskMonitor:
             if alert.timestamp >= cutoff_time
         ]
         
-        stats = {
-            'total': len(recent_alerts),
-            'critical': len([a for a in recent_alerts if a.risk_level == RiskLevel.CRITICAL]),
-            'high': len([a for a in recent_alerts if a.risk_level == RiskLevel.HIGH]),
-            'medium': len([a for a in recent_alerts if a.risk_level == RiskLevel.MEDIUM]),
-            'low': len([a for a in recent_alerts if a.risk_level == RiskLevel.LOW]),
-            'acknowledged': len([a for a in recent_alerts if a.acknowledged]),
-            'resolved': len([a for a in recent_alerts if a.resolved])
-        }
+        stats = {'total': len(recent_alerts), 'critical': 0, 'high': 0, 'medium': 0, 'low': 0,
+                 'acknowledged': 0, 'resolved': 0}
+        for alert in recent_alerts:
+            stats[alert.risk_level.value] += 1
+            stats['acknowledged'] += alert.acknowledged
+            stats['resolved'] += alert.resolved
         
         return stats
     
@@ -498,11 +491,10 @@ class RiskMonitor:
         
         cutoff_time = datetime.now() - timedelta(hours=hours)
         
-        # 风险事件统计
-        risk_events = self.risk_config.get_recent_events(hours)
-        event_stats = defaultdict(int)
-        for event in risk_events:
-            event_stats[event.risk_level.value] += 1
+        # 风险事件统计（直接按列计数，不构造事件对象）
+        risk_event_stats = self.risk_config.get_recent_event_stats(hours)
+        event_stats = defaultdict(int, {level: count for level, count
+                                        in risk_event_stats['by_level'].items() if count})
         
         # 告警统计
         alert_stats = self.get_alert_statistics(hours)
@@ -513,23 +505,20 @@ class RiskMonitor:
             'report_period': f"{hours} hours",
             'generated_at': datetime.now().isoformat(),
             'summary': {
-                'total_risk_events': len(risk_events),
+                'total_risk_events': sum(event_stats.values()),
                 'total_alerts': alert_stats['total'],
                 'critical_issues': event_stats['critical'] + alert_stats['critical'],
                 'overall_risk_score': self.risk_metrics.get('overall_risk_score', {}).value if hasattr(self.risk_metrics.get('overall_risk_score', {}), 'value') else 0
             },
             'risk_events': {
                 'by_level': dict(event_stats),
-                'by_type': defaultdict(int)
+                'by_type': defaultdict(int, {event_type: count for event_type, count
+                                             in risk_event_stats['by_type'].items() if count})
             },
             'alerts': alert_stats,
             'recommendations': self._generate_recommendations()
         }
         
-        # 按事件类型统计
-        for event in risk_events:
-            report['risk_events']['by_type'][event.event_type.value] += 1
-        
         return report
     
     def _generate_recommendations(self) -> List[str]:
@@ -12,6 +12,7 @@
 
 import sys
 import os
+import tempfile
 import unittest
 import pandas as pd
 import numpy as np
@@ -22,8 +23,8 @@ from unittest.mock import Mock, patch
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # 导入风控模块
-from src.risk.risk_config import RiskConfig, RiskLevel, RiskEventType
-from src.risk.base_risk import BaseRiskManager, RiskCheckStatus
+from src.risk.risk_config import RiskConfig, RiskLevel, RiskEventType, RiskEvent, RiskEventLog
+from src.risk.base_risk import BaseRiskManager, RiskCheckStatus, PortfolioArrays
 from src.risk.position_manager import PositionManager, PositionType
 from src.risk.money_manager import MoneyManager, FundType
 from src.risk.risk_monitor import RiskMonitor
@@ -80,6 +81,92 @@ class TestRiskConfig(unittest.TestCase):
         self.assertEqual(recent_events[0].symbol, "000001.SZ")
 
 
+class TestRiskEventLog(unittest.TestCase):
+    """测试风控事件列式存储"""
+    
+    def _event(self, timestamp, symbol="000001.SZ", level=RiskLevel.HIGH):
+        return RiskEvent(
+            event_type=RiskEventType.STOP_LOSS,
+            symbol=symbol,
+            timestamp=timestamp,
+            risk_level=level,
+            message=f"{symbol} {timestamp:%H:%M:%S}"
+        )
+    
+    def test_sorted_window_and_symbol_index(self):
+        """测试有序追加时的时间窗口与按股票查询（跨多个列块）"""
+        log = RiskEventLog()
+        base = datetime(2024, 1, 2, 9, 30)
+        total = RiskEventLog.FLUSH_SIZE * 2 + 10
+        for i in range(total):
+            log.append(self._event(base + timedelta(seconds=i), symbol=f"S{i % 3}"))
+        
+        self.assertEqual(len(log), total)
+        cutoff = base + timedelta(seconds=total - 20)
+        self.assertEqual(len(log.since(cutoff)), 20)
+        self.assertEqual(log.count_since(cutoff), 20)
+        
+        events = log.since(cutoff, symbol="S1")
+        expected = [i for i in range(total - 20, total) if i % 3 == 1]
+        self.assertEqual([e.timestamp for e in events],
+                         [base + timedelta(seconds=i) for i in expected])
+        self.assertEqual(log.since(cutoff, symbol="UNKNOWN"), [])
+    
+    def test_window_after_out_of_order_append(self):
+        """测试乱序追加后的时间窗口、计数和清理"""
+        log = RiskEventLog()
+        base = datetime(2024, 1, 2, 9, 30)
+        offsets = [5, 1, 9, 3, 7, 0, 8]
+        for offset in offsets:
+            log.append(self._event(base + timedelta(minutes=offset)))
+        
+        cutoff = base + timedelta(minutes=4)
+        events = log.since(cutoff)
+        self.assertEqual(sorted(e.timestamp for e in events),
+                         [base + timedelta(minutes=m) for m in (5, 7, 8, 9)])
+        self.assertEqual(log.count_since(cutoff), 4)
+        self.assertEqual(log.value_counts(cutoff, 'risk_level')[RiskLevel.HIGH], 4)
+        
+        self.assertEqual(log.prune(cutoff), 3)
+        self.assertEqual(len(log), 4)
+        self.assertEqual(len(log.since(base)), 4)
+    
+    def test_eviction_at_max_events(self):
+        """测试超出容量时淘汰最早写入的事件"""
+        max_events = RiskEventLog.FLUSH_SIZE + 50
+        log = RiskEventLog(max_events=max_events)
+        base = datetime(2024, 1, 2, 9, 30)
+        total = RiskEventLog.FLUSH_SIZE * 3
+        for i in range(total):
+            log.append(self._event(base + timedelta(seconds=i)))
+        
+        events = list(log)
+        self.assertEqual(len(log), max_events)
+        self.assertEqual(len(events), max_events)
+        self.assertEqual(events[0].timestamp, base + timedelta(seconds=total - max_events))
+        self.assertEqual(events[-1].timestamp, base + timedelta(seconds=total - 1))
+    
+    def test_snapshot_round_trip(self):
+        """测试事件快照保存与加载"""
+        risk_config = RiskConfig()
+        now = datetime.now()
+        for i in range(RiskEventLog.FLUSH_SIZE + 5):
+            risk_config.add_risk_event(self._event(now - timedelta(seconds=i), symbol=f"S{i % 4}"))
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            snapshot_file = os.path.join(temp_dir, 'risk_events.snapshot')
+            self.assertTrue(risk_config.save_snapshot(snapshot_file))
+            
+            restored = RiskConfig()
+            self.assertTrue(restored.load_snapshot(snapshot_file))
+        
+        original = [e.to_dict() for e in risk_config.get_recent_events(1)]
+        self.assertEqual([e.to_dict() for e in restored.get_recent_events(1)], original)
+        self.assertEqual(len(restored.get_events_by_symbol("S2", 1)),
+                         len(risk_config.get_events_by_symbol("S2", 1)))
+        self.assertEqual(restored.get_recent_event_counts(1), risk_config.get_recent_event_counts(1))
+
+
 class TestBaseRiskManager(unittest.TestCase):
     """测试基础风控管理器"""
     
@@ -137,6 +224,100 @@ class TestBaseRiskManager(unittest.TestCase):
         status = self.risk_manager.get_rule_status()
         self.assertTrue(status['stop_loss']['enabled'])
 
+    
+    def _portfolio_frame(self, n=200):
+        rng = np.random.default_rng(0)
+        return pd.DataFrame({
+            'symbol': [f"S{i:04d}" for i in range(n)],
+            'current_price': rng.uniform(8, 12, n),
+            'avg_price': rng.uniform(8, 12, n),
+            'position_size': rng.integers(0, 3, n) * 100,
+            'prev_close': rng.uniform(9, 11, n),
+        })
+    
+    def test_fused_scan_matches_scalar_rules(self):
+        """测试融合扫描与逐票规则结果一致"""
+        df = self._portfolio_frame()
+        now = datetime.now()
+        fused = self.risk_manager._check_portfolio_fused(PortfolioArrays.from_dataframe(df), now)
+        
+        violations, warnings, blocked = [], [], []
+        for row in df.to_dict('records'):
+            for rule_name in ('stop_loss', 'stop_profit', 'price_limit'):
+                result = self.risk_manager.rules[rule_name].check(now=now, **row)
+                violations.extend(v.message for v in result.violations)
+                warnings.extend(result.warnings)
+                blocked.extend(result.blocked_operations)
+        
+        self.assertTrue(violations)
+        self.assertEqual(sorted(v.message for v in fused.violations), sorted(violations))
+        self.assertEqual(sorted(fused.warnings), sorted(warnings))
+        self.assertEqual(sorted(fused.blocked_operations), sorted(blocked))
+    
+    def test_batch_rules_match_scalar_rules(self):
+        """测试 PortfolioArrays 批量检查与逐票检查一致"""
+        df = self._portfolio_frame()
+        rng = np.random.default_rng(1)
+        df['volume'] = rng.uniform(0, 100, len(df))
+        df['avg_volume'] = rng.uniform(50, 100, len(df))
+        portfolio = PortfolioArrays.from_dataframe(df)
+        now = datetime.now()
+        
+        for rule_name in ('stop_loss', 'stop_profit', 'price_limit', 'liquidity'):
+            rule = self.risk_manager.rules[rule_name]
+            batch = rule.check_batch(portfolio, now)
+            scalar = [v.message for row in df.to_dict('records')
+                      for v in rule.check(now=now, **row).violations]
+            self.assertEqual(sorted(v.message for v in batch.violations), sorted(scalar), rule_name)
+    
+    def test_portfolio_without_optional_columns(self):
+        """测试组合数据缺少波动率、成交量列时不产生规则执行失败"""
+        result = self.risk_manager.check_all_rules(
+            portfolio=self._portfolio_frame(), total_pnl_today=0.0, initial_capital=1e6
+        )
+        self.assertFalse([w for w in result.warnings if '执行失败' in w])
+    
+    def test_volatility_rule_with_zero_price(self):
+        """测试价格序列含零值时波动率规则不抛出异常"""
+        result = self.risk_manager.rules['volatility'].check(
+            symbol="000001.SZ", price_data=pd.Series([1.0, 0.0, 2.0, 3.0])
+        )
+        self.assertEqual(result.status, RiskCheckStatus.PASS)
+    
+    def test_daily_loss_repeated_breach(self):
+        """测试持续超出单日亏损时每次检查按当次时间记录违规"""
+        rule = self.risk_manager.rules['daily_loss']
+        first_time = datetime.now().replace(hour=10, minute=0, second=0, microsecond=0)
+        second_time = first_time + timedelta(seconds=2)
+        
+        first = rule.check(-100000.0, 1e6, now=first_time)
+        second = rule.check(-100000.0, 1e6, now=second_time)
+        self.assertEqual(second.status, RiskCheckStatus.BLOCKED)
+        self.assertEqual(first.violations[0].timestamp, first_time)
+        self.assertEqual(second.violations[0].timestamp, second_time)
+        
+        self.risk_manager.check_all_rules(total_pnl_today=-100000.0, initial_capital=1e6)
+        self.risk_manager.check_all_rules(total_pnl_today=-100000.0, initial_capital=1e6)
+        events = [e for e in self.risk_config.get_recent_events(1) if e.symbol == "PORTFOLIO"]
+        self.assertEqual(len(events), 2)
+        self.assertLess(events[0].timestamp, events[1].timestamp)
+    
+    def test_check_symbols_records_each_event_once(self):
+        """测试多线程逐票检查时每条违规只记录一次事件"""
+        for rule_name in ('trading_time', 'daily_loss', 'volatility', 'liquidity', 'price_limit'):
+            self.risk_manager.disable_rule(rule_name)
+        symbol_params = [
+            {'symbol': f"S{i:04d}", 'current_price': 9.0, 'avg_price': 10.0,
+             'position_size': 100, 'prev_close': 10.0}
+            for i in range(2000)
+        ]
+        
+        result = self.risk_manager.check_symbols(symbol_params, max_workers=8)
+        self.assertEqual(len(result.violations), 2000)
+        self.assertEqual(len(self.risk_config.risk_events), 2000)
+        self.assertEqual([v.symbol for v in result.violations],
+                         [p['symbol'] for p in symbol_params])
+
 
 class TestPositionManager(unittest.TestCase):
     """测试仓位管理器"""
@@ -439,6 +620,7 @@ def create_test_suite():
     # 添加所有测试类
     test_classes = [
         TestRiskConfig,
+        TestRiskEventLog,
         TestBaseRiskManager,
         TestPositionManager,
         TestMoneyManager,
@@ -8,4 +8,5 @@ from .test_strategies_unit import *
 from .test_backtest_unit import *
 from .test_risk_unit import *
 from .test_trading_unit import *
-from .test_monitor_unit import *
\ No newline at end of file
+from .test_monitor_unit import *
+from .test_validation_unit import *
\ No newline at end of file